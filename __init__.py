@@ -11,4 +11,4 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), sysdir))
 os.environ['PATH'] = os.environ['PATH'] + ";."
 
 from .better_ac import *
-from .car import Car, PlayerCar
\ No newline at end of file
+from .car import Car, PlayerCar, do_frame_cache, do_shared_memory, frame_tick
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Objects and bytes allocated per frame by a loop that reads the front left and rear right
+tyre of every car, measured with tracemalloc. Each frame keeps the objects it used, like
+a HUD that builds its rows first, so every allocation is still alive when it is measured.
+Run with: python benchmarks/bench_car_allocations.py
+"""
+import tracemalloc
+
+import stub_ac
+
+stub_ac.load_package()
+from better_ac.car import Car, Tyre
+
+CARS = 20
+
+
+def interned_frame(rows):
+    for car_id in range(CARS):
+        car = Car(car_id)
+        rows.append((car, car.fl, car.rr))
+
+
+def fresh_objects_frame(rows):
+    # What every access used to do: build a new Car and new Tyre objects.
+    for car_id in range(CARS):
+        rows.append((object.__new__(Car), Tyre(0, car_id), Tyre(3, car_id)))
+
+
+def measure(frame) -> 'tuple[int, int]':
+    frame([])
+    # Grow the list up front, so its own storage is not counted.
+    rows = [None] * CARS
+    del rows[:]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    frame(rows)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    return blocks, size
+
+
+def main():
+    for name, frame in ("interned", interned_frame), ("fresh", fresh_objects_frame):
+        blocks, size = measure(frame)
+        print("{:<10} {:5d} blocks {:7d} bytes per frame ({} cars)".format(name, blocks, size, CARS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Per-frame cost of reading a HUD's worth of car channels property by property
+compared to a single Car.snapshot(). Run with: python benchmarks/bench_car_snapshot.py
+"""
+import timeit
+
+import stub_ac
+
+stub_ac.load_package()
+from better_ac.car import Car
+
+FIELDS = (
+    "speed_kmh", "throttle", "brake", "clutch", "gear", "rpm", "lap_count", "lap_time",
+    "last_lap_time", "best_lap", "normalized_spline_position", "performance_meter",
+    "steer_rotation", "turbo_boost", "drs_available", "drs_enabled", "is_engine_limiter_on",
+    "world_position", "velocity", "gravity_acceleration",
+)
+CARS = 20
+FRAMES = 200
+
+
+def properties(cars):
+    for car in cars:
+        for name in FIELDS:
+            getattr(car, name)
+
+
+def snapshots(cars):
+    for car in cars:
+        car.snapshot(FIELDS)
+
+
+def main():
+    cars = [Car(car_id) for car_id in range(CARS)]
+    for name, function in ("properties", properties), ("snapshot", snapshots):
+        function(cars)
+        seconds = min(timeit.repeat(lambda: function(cars), number=FRAMES, repeat=5)) / FRAMES
+        print("{:<10} {:8.1f} us per frame ({} cars x {} channels)".format(name, seconds * 1e6, CARS, len(FIELDS)))
+
+
+if __name__ == "__main__":
+    main()
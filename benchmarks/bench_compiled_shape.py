@@ -0,0 +1,45 @@
+"""
+Time per frame to draw a static shape of 2000 triangles by walking its objects
+(Triangle -> Vertex -> Color) compared to its compiled stream.
+Run with: python benchmarks/bench_compiled_shape.py
+"""
+import timeit
+
+import stub_ac
+
+stub_ac.load_package()
+from better_ac.graphics import Color, Vertex, Triangle, Shape, GL_TRIANGLES, _draw_vertices
+
+TRIANGLES = 2000
+FRAMES = 20
+
+
+def gauge() -> Shape:
+    colors = [Color(255, 255, 255), Color(255, 128, 0), Color(255, 0, 0)]
+    vertices = []
+    triangles = []
+    for index in range(TRIANGLES):
+        color = colors[index * len(colors) // TRIANGLES]
+        corners = [Vertex(index, 0, color), Vertex(index + 1, 0, color), Vertex(index, 10, color)]
+        vertices.extend(corners)
+        triangles.append(Triangle(*corners))
+    return Shape(vertices, triangles)
+
+
+def main():
+    shape = gauge()
+
+    def walk():
+        vertices = []
+        for triangle in shape.triangles:
+            vertices.extend((triangle.v1, triangle.v2, triangle.v3))
+        _draw_vertices(GL_TRIANGLES, vertices)
+
+    for name, frame in ("objects", walk), ("compiled", shape.draw):
+        frame()
+        seconds = min(timeit.repeat(frame, number=FRAMES, repeat=3)) / FRAMES
+        print("{:<10} {:8.2f} ms per frame ({} triangles)".format(name, seconds * 1e3, TRIANGLES))
+
+
+if __name__ == "__main__":
+    main()
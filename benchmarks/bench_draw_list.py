@@ -0,0 +1,45 @@
+"""
+GL calls and time per frame for a track map of line segments drawn one by one
+compared to a DrawList. Run with: python benchmarks/bench_draw_list.py
+"""
+import math
+import timeit
+
+import stub_ac
+
+stub_ac.load_package()
+from better_ac.graphics import Color, Vertex, Line, DrawList
+
+SEGMENTS = 2000
+FRAMES = 20
+
+
+def track_map() -> 'list[Line]':
+    colors = (Color(255, 255, 255), Color(255, 0, 0))
+    points = [
+        Vertex(200 + 150 * math.cos(angle), 200 + 100 * math.sin(2 * angle), colors[index // 100 % 2])
+        for index, angle in enumerate(2 * math.pi * i / SEGMENTS for i in range(SEGMENTS))
+    ]
+    return [Line(points[i - 1], points[i]) for i in range(SEGMENTS)]
+
+
+def main():
+    lines = track_map()
+    draw_list = DrawList()
+    for line in lines:
+        draw_list.add(line)
+
+    def one_by_one():
+        for line in lines:
+            line.draw()
+
+    for name, frame in ("lines", one_by_one), ("draw list", draw_list.draw):
+        stub_ac.calls.clear()
+        frame()
+        calls = stub_ac.gl_calls()
+        seconds = min(timeit.repeat(frame, number=FRAMES, repeat=3)) / FRAMES
+        print("{:<10} {:6d} GL calls {:8.2f} ms per frame ({} segments)".format(name, calls, seconds * 1e3, SEGMENTS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Per-frame cost of reading the player car channels that are also in the shared memory,
+through ac.getCarState and through the shared memory pages (one snapshot per frame).
+The stand-in getCarState is a plain Python function, so in the game, where every call
+crosses into C, the difference is larger.
+Run with: python benchmarks/bench_player_shared.py
+"""
+import timeit
+
+import stub_ac
+
+stub_ac.load_package()
+from better_ac.car import PlayerCar, do_frame_cache, do_shared_memory, frame_tick
+
+FIELDS = (
+    "speed_kmh", "throttle", "brake", "gear", "rpm", "gravity_acceleration", "velocity",
+)
+TYRE_FIELDS = ("tyre_slip", "load", "suspension_travel", "core_temperature", "brake_temperature")
+FRAMES = 2000
+
+
+def frame(car):
+    frame_tick()
+    for name in FIELDS:
+        getattr(car, name)
+    for tyre in car.get_all_tyres():
+        for name in TYRE_FIELDS:
+            getattr(tyre, name)
+
+
+def main():
+    car = PlayerCar()
+    do_frame_cache(True)
+    for name, enable in ("ac", False), ("shared", True):
+        do_shared_memory(enable)
+        frame(car)
+        stub_ac.calls.clear()
+        seconds = min(timeit.repeat(lambda: frame(car), number=FRAMES, repeat=5)) / FRAMES
+        calls = sum(stub_ac.calls.values()) // (FRAMES * 5)
+        print("{:<8} {:7.1f} us per frame, {:3d} ac calls per frame".format(name, seconds * 1e6, calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Check that SimInfo.close() stops every open frame stream: the consumers of both pages
+get a RuntimeError instead of waiting forever, and the mappings are closed.
+Run with: python benchmarks/check_close_streams.py
+"""
+import asyncio
+
+import stub_ac
+
+stub_ac.load_package()
+from better_ac.sim_info import SimInfo
+
+
+async def consume(info, page):
+    try:
+        async for _ in info.frames(page):
+            pass
+    except RuntimeError as error:
+        return str(error)
+
+
+async def check():
+    info = SimInfo()
+    consumers = [asyncio.ensure_future(consume(info, page)) for page in ("physics", "graphics")]
+    await asyncio.sleep(0.05)
+    info.close()
+    errors = await asyncio.wait_for(asyncio.gather(*consumers), 2.0)
+    assert all(errors), errors
+    assert info._closed and not info._streams
+    info.close()
+    print("closed {} streams: {}".format(len(errors), errors[0]))
+
+
+if __name__ == "__main__":
+    asyncio.run(check())
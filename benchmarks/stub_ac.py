@@ -0,0 +1,95 @@
+"""
+Stand-ins for the ac and acsys modules of Assetto Corsa, so the package can be
+imported and benchmarked outside the game. Every call to an ac function is counted,
+including the GL calls of the graphics module.
+"""
+import os
+import sys
+import types
+import importlib.util
+from collections import Counter
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The car states that return three values or one value per wheel.
+VECTOR_STATES = {
+    "AccG", "LocalAngularVelocity", "LocalVelocity", "SpeedTotal", "Velocity", "WheelAngularSpeed",
+    "WorldPosition", "TyreContactPoint", "TyreContactNormal", "TyreHeadingVector", "LastTyresTemp",
+}
+WHEEL_STATES = {
+    "CamberRad", "CamberDeg", "SlipAngle", "SlipRatio", "Mz", "Load", "TyreRadius", "NdSlip", "TyreSlip",
+    "DY", "CurrentTyresCoreTemp", "DynamicPressure", "TyreLoadedRadius", "SuspensionTravel",
+    "TyreDirtyLevel", "SlipAngleContactPatch", "RideHeight",
+}
+
+calls = Counter()
+
+
+class _Constants:
+    """
+    The acsys.CS constants, every name is its own value.
+    """
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return name
+
+
+def gl_calls() -> int:
+    """
+    The number of calls to ac.gl* functions since the counters were cleared.
+    """
+    return sum(count for name, count in calls.items() if name.startswith("gl"))
+
+
+def _get_car_state(car_id, state, *args):
+    calls["getCarState"] += 1
+    if state in VECTOR_STATES:
+        return (1.0, 2.0, 3.0)
+    if state in WHEEL_STATES:
+        return [0.1, 0.2, 0.3, 0.4]
+    return 1.0
+
+
+def _function(name: str):
+    def function(*args):
+        calls[name] += 1
+        return 0
+    function.__name__ = name
+    return function
+
+
+def _module_getattr(name: str):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return _function(name)
+
+
+def install() -> None:
+    """
+    Register the ac and acsys stand-ins in sys.modules.
+    """
+    ac = types.ModuleType("ac")
+    ac.getCarState = _get_car_state
+    ac.getCarsCount = lambda: 20
+    ac.__getattr__ = _module_getattr
+    acsys = types.ModuleType("acsys")
+    acsys.CS = _Constants()
+    acsys.WHEELS = types.SimpleNamespace(FL=0, FR=1, RL=2, RR=3)
+    sys.modules["ac"] = ac
+    sys.modules["acsys"] = acsys
+
+
+def load_package():
+    """
+    Install the stand-ins and import the package as better_ac, whatever its directory is called.
+    """
+    install()
+    if "better_ac" in sys.modules:
+        return sys.modules["better_ac"]
+    spec = importlib.util.spec_from_file_location(
+        "better_ac", os.path.join(PACKAGE, "__init__.py"), submodule_search_locations=[PACKAGE])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["better_ac"] = package
+    spec.loader.exec_module(package)
+    return package
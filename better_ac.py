@@ -102,4 +102,4 @@ def get_track_name() -> str:
     """
     Get the name of the track.
     """
-    return info.static.track
\ No newline at end of file
+    return info.static_strings.track
\ No newline at end of file
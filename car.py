@@ -2,15 +2,126 @@ import ac
 import acsys
 
 from .vectors import Vector3D
+from .channels import CAR_CHANNELS, TYRE_CHANNELS, car_channel, install, install_shared
 from .exceptions import ACCarStateError, raise_car_state_error
 from .better_ac import log
-from .sim_info import info
+from .sim_info import info, SimFrame
+
+_frame_cache_enabled = False
+_frame_cache = {}
+_shared_memory_enabled = False
+_shared_frame = None
+# The frame that is refilled once per tick while the frame cache is enabled.
+_shared_buffer = SimFrame()
+# The static information of the current session that PlayerCar reads, see frame_tick().
+_static_info = info.static_info
+
+def do_frame_cache(enable: bool) -> None:
+    """
+    Enable or disable the frame cache. While it is enabled, each car state is fetched
+    from the game at most once per frame, e.g. reading the load of all four tyres makes
+    one call instead of four. Call frame_tick() at the start of every frame.
+
+    :param enable: If True, the frame cache is enabled. If False, it is disabled.
+    """
+    global _frame_cache_enabled, _shared_frame
+    _frame_cache_enabled = enable
+    _frame_cache.clear()
+    _shared_frame = None
+
+def do_shared_memory(enable: bool) -> None:
+    """
+    Enable or disable reading the PlayerCar channels that are also in the shared memory
+    (speed, pedals, gear, rpm, accG, velocity, tyre loads, slip, temperatures ...) from
+    the shared memory pages instead of ac.getCarState. While the frame cache is enabled,
+    the pages are copied once per frame with SimInfo.snapshot(), so all of them come
+    from the same physics step. Otherwise they are read from the live pages.
+    The values are converted to the units of the Car properties.
+
+    :param enable: If True, the shared memory is used. If False, it is not.
+    """
+    global _shared_memory_enabled, _shared_frame
+    _shared_memory_enabled = enable
+    _shared_frame = None
+
+def frame_tick() -> None:
+    """
+    Start a new frame, so the next reads fetch fresh car states, and pick up the static
+    information of a new session. Call this at the start of the render callback.
+    """
+    global _shared_frame, _static_info
+    _frame_cache.clear()
+    _shared_frame = None
+    # Another caller may already have seen the new session, so always take the current record.
+    _static_info = info.static_info
 
 #@raise_car_state_error
 def car_state(*args):
-    return ac.getCarState(*args)
+    if not _frame_cache_enabled:
+        return ac.getCarState(*args)
+    try:
+        return _frame_cache[args]
+    except KeyError:
+        value = _frame_cache[args] = ac.getCarState(*args)
+        return value
+
+def shared_frame():
+    """
+    The pages that PlayerCar reads from, or None if the shared memory is not used.
+    """
+    global _shared_frame
+    if not _shared_memory_enabled:
+        return None
+    if not _frame_cache_enabled:
+        return info
+    if _shared_frame is None:
+        _shared_frame = info.snapshot(frame=_shared_buffer)
+    return _shared_frame
+
+
+
+class CarSnapshot:
+    """
+    A record of car channels, as returned by Car.snapshot(). The attributes are the
+    requested channel names, and the same record is refilled by every snapshot.
+    Vector channels keep their Vector3D objects, which are updated in place.
+    """
+    __slots__ = ("car_id",)
 
 
+class _SnapshotReader:
+    """
+    A compiled reader of a fixed set of channels for one car: the functions, constants
+    and arguments are resolved once, so reading is a single loop of calls.
+    """
+
+    def __init__(self, car_id: int, fields: 'tuple[str]'):
+        record_class = type("CarSnapshot", (CarSnapshot,), {"__slots__": fields})
+        self.record = record_class()
+        self.record.car_id = car_id
+        plan = []
+        for name in fields:
+            channel = car_channel(name)
+            function, args, _, transform = channel.reader(car_id)
+            vector = None
+            if channel.is_vector:
+                vector = Vector3D()
+                setattr(self.record, name, vector)
+            plan.append((name, function, args, transform, vector))
+        self._plan = tuple(plan)
+
+    def read(self) -> CarSnapshot:
+        record = self.record
+        for name, function, args, transform, vector in self._plan:
+            value = function(*args)
+            if vector is not None:
+                vector.update(value)
+                continue
+            if transform is not None:
+                value = transform(value)
+            setattr(record, name, value)
+        return record
+
 ###############################################
 ################Car Portion####################
 ###############################################
@@ -25,15 +136,51 @@ class Car:
     """
     A class representing a car. It is used to access various properties of the car.
     It can be any car in the session. All fields are read-only.
+    Cars are interned, Car(n) always returns the same object for the same ID.
     """
+    __slots__ = ("_car_id", "_snapshots", "_tyres")
+
+    _instances = {}
+
+    def __new__(cls, car_id: int = 0):
+        key = (cls, car_id)
+        instance = Car._instances.get(key)
+        if instance is None:
+            instance = Car._instances[key] = super().__new__(cls)
+            instance._car_id = car_id
+            instance._snapshots = {}
+            tyre = cls._tyre_class
+            instance._tyres = (
+                tyre(acsys.WHEELS.FL, car_id),
+                tyre(acsys.WHEELS.FR, car_id),
+                tyre(acsys.WHEELS.RL, car_id),
+                tyre(acsys.WHEELS.RR, car_id),
+            )
+        return instance
 
     def __init__(self, car_id: int):
         """
         Initialize the Car object with a car ID.
+        The object is set up once in __new__, since cars are interned.
         
         :param car_id: The ID of the car, 0 would refer to the player car.
         """
-        self._car_id = car_id
+
+    def snapshot(self, fields: 'tuple[str]') -> CarSnapshot:
+        """
+        Read many channels in one pass, e.g. car.snapshot(("speed_kmh", "gear", "rpm")).speed_kmh.
+        The fields are the names of Car properties. The reader for a set of fields is compiled
+        on first use, and the same record object is refilled and returned on every call,
+        so copy the values that must outlive the frame.
+
+        :param fields: The names of the channels to read.
+        """
+        if type(fields) is not tuple:
+            fields = tuple(fields)
+        reader = self._snapshots.get(fields)
+        if reader is None:
+            reader = self._snapshots[fields] = _SnapshotReader(self._car_id, fields)
+        return reader.read()
 
     @staticmethod
     def _test(instance):
@@ -58,613 +205,40 @@ class Car:
         """
         The front left tyre of the car.
         """
-        return Tyre(acsys.WHEELS.FL, self._car_id)
+        return self._tyres[0]
     
     @property
     def fr(self) -> 'Tyre':
         """
         The front right tyre of the car.
         """
-        return Tyre(acsys.WHEELS.FR, self._car_id)
+        return self._tyres[1]
     
     @property
     def rl(self) -> 'Tyre':
         """
         The rear left tyre of the car.
         """
-        return Tyre(acsys.WHEELS.RL, self._car_id)
+        return self._tyres[2]
     
     @property
     def rr(self) -> 'Tyre':
         """
         The rear right tyre of the car.
         """
-        return Tyre(acsys.WHEELS.RR, self._car_id)
+        return self._tyres[3]
     
     def get_all_tyres(self) -> 'tuple[Tyre, Tyre, Tyre, Tyre]':
         """
         Get all tyres of the car.  
         """
-        return (self.fl, self.fr, self.rl, self.rr)
-
-    @property
-    #@raise_car_state_error
-    def speed_ms(self) -> float:
-        """
-        The speed of the car in meters per second.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SpeedMS)
-    
-    @property
-    #@raise_car_state_error
-    def speed_mph(self) -> float:
-        """
-        Tthe speed of the car in miles per hour.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SpeedMPH)
-
-    @property
-    #@raise_car_state_error
-    def speed_kmh(self) -> float:
-        """
-        The speed of the car in kilometers per hour.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SpeedKMH)
-
-    @property
-    #@raise_car_state_error
-    def throttle(self) -> float:
-        """
-        The gas pedal position.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Gas)
-    
-    @property
-    #@raise_car_state_error
-    def brake(self) -> float:
-        """
-        The brake pedal position.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Brake)
-    
-    @property
-    #@raise_car_state_error
-    def clutch(self) -> float:
-        """
-        The clutch pedal position.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Clutch)
-    
-    @property
-    #@raise_car_state_error
-    def gear(self) -> int:
-        """
-        The current gear of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Gear)
-    
-    @property
-    #@raise_car_state_error
-    def best_lap(self) -> float:
-        """
-        The best lap time of the car in milliseconds.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.BestLap)
-    
-    @property
-    #@raise_car_state_error
-    def cg_height(self) -> float:
-        """
-        The height of the center of gravity of the car from the ground.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.CGHeight)
-    
-    @property
-    #@raise_car_state_error
-    def best_drift_lap(self) -> float:
-        """
-        The best lap points in drift mode.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DriftBestLap)
-    
-    @property
-    #@raise_car_state_error
-    def last_drift_lap(self) -> float:
-        """
-        The last lap points in drift mode.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DriftLastLap)
-    
-    @property
-    #@raise_car_state_error
-    def drift_points(self) -> float:
-        """
-        The drift points of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DriftPoints)
-    
-    @property
-    #@raise_car_state_error
-    def drive_train_speed(self) -> float:
-        """
-        The speed of the drive train (speed delivered to the wheels).
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DriveTrainSpeed)
-    
-    @property
-    #@raise_car_state_error
-    def rpm(self) -> float:
-        """
-        The current RPM of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.RPM)
-    
-    @property
-    #@raise_car_state_error
-    def drift_points(self) -> float:
-        """
-        The drift points of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.InstantDrift)
-    
-    @property
-    #@raise_car_state_error
-    def is_drift_invalid(self) -> bool:
-        """
-        Check if the drift is invalid.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.IsDriftInvalid) == 1
-    
-    @property
-    #@raise_car_state_error
-    def is_engine_limiter_on(self) -> bool:
-        """
-        Check if the engine limiter is on.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.IsEngineLimiterOn) == 1
-    
-    @property
-    #@raise_car_state_error
-    def lap_count(self) -> int:
-        """
-        The lap count of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.LapCount)
-    
-    @property
-    #@raise_car_state_error
-    def is_lap_invalidated(self) -> bool:
-        """
-        Check if the lap is invalidated.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.LapInvalidated) == 1
-    
-    @property
-    #@raise_car_state_error
-    def lap_time(self) -> float:
-        """
-        The lap time of the car in milliseconds.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.LapTime)
-    
-    @property
-    #@raise_car_state_error
-    def last_lap_time(self) -> float:
-        """
-        The last lap time of the car in milliseconds.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.LastLap)
-    
-    @property
-    #@raise_car_state_error
-    def normalized_spline_position(self) -> float:
-        """
-        The normalized position of the car on the track.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.NormalizedSplinePosition)
-    
-    @property
-    #@raise_car_state_error
-    def performance_meter(self) -> float:
-        """
-        Projection of how many seconds is the current time far from
-        the current best lap
-        """
-        return ac.getCarState(self._car_id, acsys.CS.PerformanceMeter)
-    
-    @property
-    #@raise_car_state_error
-    def steer_rotation(self) -> float:
-        """
-        The radians of steer rotation.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Steer)
-    
-    @property
-    #@raise_car_state_error
-    def turbo_boost(self) -> float:
-        """
-        The turbo gain on engine torque of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TurboBoost)
-    
-    @property
-    #@raise_car_state_error
-    def caster_angle(self) -> float:
-        """
-        The caster angle of the car in radians.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Caster)
-    
-    @property
-    #@raise_car_state_error
-    def gravity_acceleration(self) -> Vector3D:
-        """
-        The gravity acceleration on the vehicles center of gravity.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.AccG))
-    
-    @property
-    #@raise_car_state_error
-    def local_angular_velocity(self) -> Vector3D:
-        """
-        The angular velocity of the car, using the car as origin.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.LocalAngularVelocity))
-    
-    @property
-    #@raise_car_state_error
-    def local_velocity(self) -> Vector3D:
-        """
-        The velocity using the car as origin.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.LocalVelocity))
-    
-    @property
-    #@raise_car_state_error
-    def speed_total(self) -> 'tuple[float, float, float]':
-        """
-        The speed in all three units: km/h, mph, m/s.
-        """
-        return tuple(ac.getCarState(self._car_id, acsys.CS.SpeedTotal))
-    
-    @property
-    #@raise_car_state_error
-    def velocity(self) -> Vector3D:
-        """
-        The velocity of the car.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.Velocity))
-    
-    @property
-    #@raise_car_state_error
-    def wheel_angular_speed(self) -> Vector3D:
-        """
-        The wheel angular velocity of the car.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.WheelAngularSpeed))
+        return self._tyres
 
-    @property
-    #@raise_car_state_error
-    def world_position(self) -> Vector3D:
-        """
-        Current Car Coordinates on map.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.WorldPosition))
-    
-    @property
-    #@raise_car_state_error
-    def drs_available(self) -> bool:
-        """
-        Check if the DRS (Drag Reduction System) is available, 
-        i.e. if the car is in a DRS zone.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DrsAvailable) == 1
-    
-    @property
-    #@raise_car_state_error
-    def drs_enabled(self) -> bool:
-        """
-        Check if the DRS (Drag Reduction System) is enabled.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DrsEnabled) == 1
-    
-    @property
-    #@raise_car_state_error
-    def spent_energy(self) -> float:
-        """
-        The spent energy of the car in Joule.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.ERSCurrentKJ) * 1000.0
-    
-    @property
-    #@raise_car_state_error
-    def ers_heat_charging_mode(self) -> int:
-        """
-        The ERS heat mode of the car.
-        0 = Motor, 1 = Battery
-        """
-        return ac.getCarState(self._car_id, acsys.CS.ERSHeatCharging)
-    
-    @property
-    #@raise_car_state_error
-    def max_ers_energy(self) -> float:
-        """
-        The maximum ERS energy of the car in Joule.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.ERSMaxJ)
-    
-    @property
-    #@raise_car_state_error
-    def ers_recovery_level(self) -> int:
-        """
-        The ERS recovery level of the car
-        """
-        return ac.getCarState(self._car_id, acsys.CS.ERSRecovery)
-    
-    @property
-    #@raise_car_state_error
-    def engine_brake_setting(self) -> int:
-        """
-        The current engine brake setting of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.EngineBrake)
-    
-    @property
-    #@raise_car_state_error
-    def battery_charge(self) -> float:
-        """
-        The KERS/ERS charge to the battery of the car. 0.0 to 1.0
-        """
-        return ac.getCarState(self._car_id, acsys.CS.KersCharge)
-    
-    @property
-    #@raise_car_state_error
-    def engine_input(self) -> float:
-        """
-        The KERS/ERS input to the engine of the car. 0.0 to 1.0
-        """
-        return ac.getCarState(self._car_id, acsys.CS.KersInput)
-    
-    @property
-    #@raise_car_state_error
-    def last_ffb(self) -> float:
-        """
-        The last force feedback value.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.LastFF)
-    
-    @property
-    #@raise_car_state_error
-    def finished_race(self) -> bool:
-        """
-        Check if the car has finished the race.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.RaceFinished) == 1
-    
-    @property
-    #@raise_car_state_error
-    def front_ride_height(self) -> float:
-        """
-        The front ride height of the car in meters.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.RideHeight)[0]
-    
-    @property
-    #@raise_car_state_error
-    def rear_ride_height(self) -> float:
-        """
-        The rear ride height of the car in meters.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.RideHeight)[1]
-    
-    @property
-    #@raise_car_state_error
-    def turbo_boost(self) -> float:
-        """
-        The turbo boost of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TurboBoost)
-    
-    @property
-    #@raise_car_state_error
-    def drag_coefficient(self):
-        """
-        The drag coefficient of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Aero, 0)
-    
-    @property
-    #@raise_car_state_error
-    def front_lift_coefficient(self):
-        """
-        The front lift coefficient of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Aero, 1)
-    
-    @property
-    #@raise_car_state_error
-    def rear_lift_coefficient(self):
-        """
-        The rear lift coefficient of the car.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Aero, 2)
-    
-    @property
-    #@raise_car_state_error
-    def ers_delivery_mode(self) -> int:
-        """
-        The index of the ERS delivery mode.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.ERSDelivery)
-    
-    @property
-    #@raise_car_state_error
-    def p2p_status(self) -> int:
-        """
-        The status index of the P2P (Push to Pass) system.
-        (I think it is: 0 = unavailable, 1 = cooldown, 2 = active, 3 = ready)
-        """
-        return ac.getCarState(self._car_id, acsys.CS.P2PStatus)
-    
-    @property
-    #@raise_car_state_error
-    def p2p_remaining(self) -> bool:
-        """
-        How many P2P (Push to Pass) activations are remaining.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.P2PActivations)
 
-    @property
-    def driver_name(self) -> str:
-        """
-        The name of the driver.
-        """
-        return ac.getDriverName(self._car_id)
-    
-    @property
-    def track_name(self) -> str:
-        """
-        The name of the track.
-        """
-        return ac.getTrackName(self._car_id)
-    
-    @property
-    def track_length(self) -> float:
-        """
-        The length of the track in meters.
-        """
-        return ac.getTrackLength(self._car_id)
-    
-    @property
-    def track_configuration_name(self) -> str:
-        """
-        The location of the track.
-        """
-        return ac.getTrackConfiguration(self._car_id)
-    
-    @property
-    def name(self) -> str:
-        """
-        The name of the car.
-        """
-        return ac.getCarName(self._car_id)
-    
-    @property
-    def last_lap_sectors(self) -> 'tuple[float, float, float]':
-        """
-        The last splits of the car.
-        """
-        return tuple(ac.getLastSplits(self._car_id))
-    
-    @property
-    def is_car_in_pitlane(self) -> bool:
-        """
-        Check if the car is in the pit lane.
-        """
-        return ac.isCarInPitlane(self._car_id) == 1
-    
-    @property
-    def is_car_in_pit(self) -> bool:
-        """
-        Check if the car is in the pit.
-        """
-        return ac.isCarInPit(self._car_id) == 1
-    
-    @property
-    def is_connected(self) -> bool:
-        """
-        Check if the car is connected.
-        """
-        return ac.isConnected(self._car_id) == 1
-    
-    @property
-    def ballast(self) -> float:
-        """
-        The car ballast value.
-        """
-        return ac.getCarBallast(self._car_id)
-    
-    @property
-    def minimum_height(self) -> float:
-        """
-        The car minimum height.
-        """
-        return ac.getCarMinHeight(self._car_id)
+# The properties of all channels in channels.py, reading through the frame cache.
+install(Car, CAR_CHANNELS, car_state)
 
-    @property
-    def leaderboard_position(self) -> int:
-        """
-        The car leaderboard position.
-        """
-        return ac.getCarLeaderboardPosition(self._car_id)
-    
-    @property
-    def real_time_leaderboard_position(self) -> int:
-        """
-        The car real time leaderboard position.
-        """
-        return ac.getCarRealTimeLeaderboardPosition(self._car_id)
-    
-    @property
-    def skin_name(self) -> str:
-        """
-        The skin name of the car.
-        """
-        return ac.getCarSkin(self._car_id)
-    
-    @property
-    def driver_nation_code(self) -> str:
-        """
-        The nation code of the driver.
-        """
-        return ac.getDriverNationCode(self._car_id)
-    
-    @property
-    def current_lap_sectors(self) -> 'tuple[int, int, int]':
-        """
-        The current sectors of the car in milliseconds.
-        """
-        return tuple(ac.getCurrentSplits(self._car_id))
-    
-    @property
-    def is_ai_controlled(self) -> bool:
-        """
-        Check if the car is controlled by AI.
-        """
-        return ac.isAIControlled(self._car_id) == 1
-    
-    @property
-    def tyre_compound(self) -> str:
-        """
-        The tyre compound of the car.
-        """
-        return ac.getCarTyreCompound(self._car_id)
-    
-    @property
-    def restrictor(self) -> float:
-        """
-        The restrictor of the car in percentage.
-        """
-        return ac.getCarRestrictor(self._car_id)
-    
-    @property
-    def num_engine_brake_settings(self) -> int:
-        """
-        The number of engine brake settings available for the car.
-        """
-        return ac.getCarEngineBrakeCount(self._car_id)
-    
-    @property
-    def num_ers_power_controller_settings(self) -> int:
-        """
-        The number of ERS power controller settings available for the car.
-        """
-        return ac.getCarPowerControllerCount(self._car_id)
-    
 
-    
-    
 class PlayerCar(Car):
     """
     A class representing the player's car. It inherits from the Car class.
@@ -672,6 +246,10 @@ class PlayerCar(Car):
     specific properties using the shared memory interface of Assetto Corsa,
     and generally functions that only apply to the player car.
     """
+    __slots__ = ()
+
+    def __new__(cls):
+        return super().__new__(cls, 0)
 
     def __init__(self):
         """
@@ -690,56 +268,56 @@ class PlayerCar(Car):
         """
         The maximum power of the car in kilowatts.
         """
-        return info.static.maxPower / 1000.0
+        return _static_info.maxPower / 1000.0
     
     @property
     def max_torque(self) -> float:
         """
         The maximum torque of the car in Newton-meters.
         """
-        return info.static.maxTorque
+        return _static_info.maxTorque
     
     @property
     def max_rpm(self) -> int:
         """
         The maximum RPM of the car.
         """
-        return info.static.maxRpm
+        return _static_info.maxRpm
     
     @property
     def max_fuel(self) -> float:
         """
         The maximum fuel capacity of the car.
         """
-        return info.static.maxFuel
+        return _static_info.maxFuel
     
     @property
     def max_turbo_boost(self) -> float:
         """
         The maximum turbo boost of the car in liters.
         """
-        return info.static.maxTurboBoost
+        return _static_info.maxTurboBoost
     
     @property
     def stability_control(self) -> float:
         """
         The stability aid of the car. 0.0 to 1.0, where 0.0 is off and 1.0 is maximum stability aid.
         """
-        return info.static.aidStability
+        return _static_info.aidStability
     
     @property
     def auto_clutch(self) -> bool:
         """
         Check if the car has auto clutch enabled.
         """
-        return info.static.aidAutoClutch == 1
+        return _static_info.aidAutoClutch == 1
     
     @property
     def auto_blip(self) -> bool:
         """
         Check if the car has auto blip enabled.
         """
-        return info.static.aidAutoBlip == 1
+        return _static_info.aidAutoBlip == 1
     
     @property
     def auto_shift(self) -> bool:
@@ -753,28 +331,28 @@ class PlayerCar(Car):
         """
         Check if the car has DRS (Drag Reduction System).
         """
-        return info.static.hasDRS == 1
+        return _static_info.hasDRS == 1
     
     @property
     def has_ers(self) -> bool:
         """
         Check if the car has ERS (Energy Recovery System).
         """
-        return info.static.hasERS == 1
+        return _static_info.hasERS == 1
     
     @property
     def has_kers(self) -> bool:
         """
         Check if the car has KERS (Kinetic Energy Recovery System).
         """
-        return info.static.hasKERS == 1
+        return _static_info.hasKERS == 1
     
     @property
     def max_kers_energy(self) -> float:
         """
         The maximum KERS energy of the car in Joule.
         """
-        return info.static.kersMaxJ 
+        return _static_info.kersMaxJ 
     
     # @property
     # def drs_enabled(self) -> bool:
@@ -910,207 +488,16 @@ class PlayerCar(Car):
 ###############################################
 
 class Tyre:
+    """
+    A class representing one tyre of a car. Use the tyres of a Car, e.g. car.fl,
+    which are created once per car.
+    """
+    __slots__ = ("_identifier", "_car_id")
+
     def __init__(self, identifier, car_id: int):
         self._identifier = identifier
         self._car_id = car_id
 
-    @property
-    #@raise_car_state_error
-    def camber_radians(self) -> float:
-        """
-        The camber angle of the tyre in radians.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.CamberRad)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def camber_degrees(self) -> float:
-        """
-        The camber angle of the tyre in degrees.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.CamberDeg)[self._identifier]
-    
-    @property
-    def slip_angle(self) -> float:
-        """
-        The slip angle of the tyre in degrees.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SlipAngle)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def slip_ratio(self) -> float:
-        """
-        The slip ratio of the tyre.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SlipRatio)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def self_aligning_torque(self) -> float:
-        """
-        The self-aligning torque of the tyre.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Mz)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def load(self) -> float:
-        """
-        The load on the tyre in Newtons.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.Load)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def radius(self) -> float:
-        """
-        The radius of the tyre in meters.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TyreRadius)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def nd_slip(self) -> float:
-        """
-        How far the tyre is from optimal slip angle.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.NdSlip)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def tyre_slip(self) -> float:
-        """
-        The tyre slip.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TyreSlip)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def dy(self) -> float:
-        """
-        I honeslty don't know what this is.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DY)[self._identifier]
-    
-    @property
-    def temperature(self) -> float:
-        """
-        The temperature of the tyre.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TyreTemp, self._identifier)
-
-    @property
-    #@raise_car_state_error
-    def core_temperature(self) -> float:
-        """
-        The core temperature of the tyre in degrees Celsius.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.CurrentTyresCoreTemp)[self._identifier]
-
-    # @property
-    # #@raise_car_state_error
-    # def thermal_state(self) -> float:
-    #     """
-    #     The temperature of the tyre.
-    #     """
-    #     return ac.getCarState(self.car_id, acsys.CS.ThermalState)[self.identifier]
-
-    @property
-    #@raise_car_state_error
-    def dynamic_pressure(self) -> float:
-        """
-        The dynamic pressure of the tyre in PSI.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.DynamicPressure)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def loaded_radius(self) -> float:
-        """
-        The loaded radius of the tyre in meters.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TyreLoadedRadius)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def suspension_travel(self) -> float:
-        """
-        The suspension travel of the tyre in meters.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SuspensionTravel)[self._identifier]
-
-    @property
-    #@raise_car_state_error
-    def dirt_level(self) -> float:
-        """
-        The dirt level of the tyre.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.TyreDirtyLevel)[self._identifier]
-    
-    @property
-    #@raise_car_state_error
-    def tyre_contact_point(self) -> Vector3D:
-        """
-        The tyre contact point of the tyre.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.TyreContactPoint, self._identifier))
-    
-    @property
-    #@raise_car_state_error
-    def tyre_contact_normal(self) -> Vector3D:
-        """
-        The tyre contact normal of the tyre.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.TyreContactNormal, self._identifier))
-    
-    @property
-    #@raise_car_state_error
-    def tyre_contact_heading(self) -> Vector3D:
-        """
-        The tyre contact heading of the tyre.
-        """
-        return Vector3D(structure=ac.getCarState(self._car_id, acsys.CS.TyreHeadingVector, self._identifier))
-    
-    @property
-    #@raise_car_state_error
-    def toe(self) -> float:
-        """
-        The toe angle of the tyre in degrees.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.ToeInDeg, self._identifier)
-    
-    @property
-    #@raise_car_state_error
-    def last_tyres_temperature(self) -> 'tuple[float, float, float]':
-        """
-        I think this is supposed to do the same as tyre_temperature in the PlayerTyre class,
-        but from testing I can't get any sensible values from it. So use at own risk I guess.
-        """
-        return tuple(ac.getCarState(self._car_id, acsys.CS.LastTyresTemp, self._identifier))
-    
-    @property
-    #@raise_car_state_error
-    def slip_angle_contact_patch(self) -> float:
-        """
-        The slip angle of the tyre at the contact patch.
-        """
-        return ac.getCarState(self._car_id, acsys.CS.SlipAngleContactPatch)[self._identifier]
-    
-    @property
-    def tyre_wear(self) -> float:
-        """
-        The wear of the tyre.
-        """
-        return ac.ext_getTyreWear(self._car_id, self._identifier)
-    
-    @property
-    def brake_temperature(self) -> float:
-        """
-        The brake temperature of the tyre in degrees Celsius.
-        """
-        return ac.ext_getBrakeTemp(self._car_id, self._identifier)
-    
     @property
     def surface_tyre_temperatures(self) -> 'tuple[float, float, float]':
         """
@@ -1122,16 +509,26 @@ class Tyre:
             ac.ext_getTyreTempM(self._car_id, self._identifier),
             ac.ext_getTyreTempO(self._car_id, self._identifier)
         )
-    
-    
 
-# class PlayerTyre(Tyre):
-#     """
-#     Tyre class for the player car. Inherits from Tyre.
-#     Provides further methods specific to the player car.
-#     """
-#     def __init__(self, identifier: int):
-#         super().__init__(identifier, 0)
+
+install(Tyre, TYRE_CHANNELS, car_state)
+
+
+class PlayerTyre(Tyre):
+    """
+    Tyre class for the player car. Inherits from Tyre.
+    Reads the channels that are in the shared memory from it, see do_shared_memory().
+    """
+    __slots__ = ()
+
+
+install_shared(PlayerCar, CAR_CHANNELS, shared_frame)
+install_shared(PlayerTyre, TYRE_CHANNELS, shared_frame)
+Car._tyre_class = Tyre
+PlayerCar._tyre_class = PlayerTyre
+
+
+# Further PlayerTyre properties, not added yet:
 
 #     # @property
 #     # def tyre_wear(self) -> float:
@@ -1145,4 +542,4 @@ class Tyre:
 #         """
 #         The maximum suspension travel of the tyre.
 #         """
-#         return info.static.suspensionMaxTravel[self._identifier]
+#         return _static_info.suspensionMaxTravel[self._identifier]
@@ -0,0 +1,94 @@
+import ac
+from array import array
+
+from .channels import car_channel
+from .vectors import Vector3DArray
+from .better_ac import get_max_cars_count
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CarTable:
+    """
+    Samples a set of channels for every car in the session into one preallocated array
+    per channel, so the whole field can be processed column by column (gaps, rankings,
+    proximity) instead of through hundreds of Car property calls.
+    Scalar channels have one value per car, vector channels such as world_position have
+    three values (x, y, z) per car, stored car after car.
+    """
+
+    def __init__(self, channels: 'list[str]', car_count: int = None):
+        """
+        :param channels: The names of the Car channels to sample, e.g. ["world_position", "speed_kmh"].
+        :param car_count: The number of cars to sample, get_max_cars_count() if None.
+        """
+        self.car_count = get_max_cars_count() if car_count is None else car_count
+        self.channels = tuple(channels)
+        self.connected = array("b", bytes(self.car_count))
+        self._columns = {}
+        plan = []
+        for name in self.channels:
+            channel = car_channel(name)
+            if not channel.is_numeric:
+                raise ValueError("Car channel '{}' is not a number and can't be sampled into a table.".format(name))
+            width = 3 if channel.is_vector else 1
+            column = self._columns[name] = array("d", bytes(8 * width * self.car_count))
+            function, args, _, transform = channel.reader(0)
+            plan.append((column, function, args[1:], None if width == 3 else transform, width))
+        self._plan = tuple(plan)
+
+    def sample(self) -> None:
+        """
+        Sample all channels of all connected cars. Call this once per tick.
+        The values of disconnected cars are left as they were, check the connected mask.
+        """
+        is_connected = ac.isConnected
+        connected = self.connected
+        plan = self._plan
+        for car_id in range(self.car_count):
+            if is_connected(car_id) != 1:
+                connected[car_id] = 0
+                continue
+            connected[car_id] = 1
+            for column, function, args, transform, width in plan:
+                value = function(car_id, *args)
+                if width == 3:
+                    index = car_id * 3
+                    column[index] = value[0]
+                    column[index + 1] = value[1]
+                    column[index + 2] = value[2]
+                else:
+                    if transform is not None:
+                        value = transform(value)
+                    column[car_id] = value
+
+    def column(self, name: str) -> array:
+        """
+        The array of a channel, indexed by car ID (times 3 for vector channels).
+        """
+        return self._columns[name]
+
+    def vectors(self, name: str) -> Vector3DArray:
+        """
+        A Vector3DArray over the array of a vector channel, without copying,
+        e.g. table.vectors("world_position").distances(player_position).
+        """
+        if not car_channel(name).is_vector:
+            raise ValueError("Car channel '{}' is not a vector.".format(name))
+        return Vector3DArray(self._columns[name])
+
+    def numpy(self, name: str) -> 'np.ndarray':
+        """
+        A zero-copy NumPy view of a channel, with shape (cars,) or (cars, 3) for vector channels.
+        Requires NumPy.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for the array views of a CarTable.")
+        column = self._columns[name]
+        view = np.frombuffer(column, dtype=np.float64)
+        if len(column) != self.car_count:
+            view = view.reshape(self.car_count, 3)
+        return view
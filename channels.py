@@ -0,0 +1,498 @@
+"""
+The channels that can be read from the game for a car or a tyre, in one table.
+The Car and Tyre properties are generated from this table, and so are the fast
+samplers (Car.snapshot(), CarTable), so every channel is described exactly once.
+"""
+import ac
+import acsys
+
+from .vectors import Vector3D
+
+# How a tyre channel gets the wheel: by indexing the four wheel values of the result,
+# or as an argument after the state constant.
+INDEX = "index"
+ARGUMENT = "argument"
+
+
+def _is_one(value) -> bool:
+    return value == 1
+
+def _vector3(value) -> Vector3D:
+    return Vector3D(structure=value)
+
+def _first(value):
+    return value[0]
+
+def _second(value):
+    return value[1]
+
+def _kilo(value: float) -> float:
+    return value * 1000.0
+
+def _kmh_to_ms(value: float) -> float:
+    return value / 3.6
+
+def _kmh_to_mph(value: float) -> float:
+    return value / 1.609344
+
+
+class SharedField:
+    """
+    Where a channel of the player car can also be read in the shared memory.
+    """
+    __slots__ = ("page", "field", "index", "convert")
+
+    def __init__(self, page: str, field: str, index: int = None, convert = None):
+        """
+        :param page: The page of the field, "physics" or "graphics".
+        :param field: The name of the field in the page.
+        :param index: The element of an array field, if fixed. Tyre channels use the wheel index instead.
+        :param convert: A function that converts the field value to the unit of the channel.
+        """
+        self.page = page
+        self.field = field
+        self.index = index
+        self.convert = convert
+
+    def read(self, frame, wheel: int = None):
+        """
+        Read the field from a frame of pages, e.g. a SimFrame or the SimInfo itself.
+
+        :param wheel: The wheel index, for tyre channels.
+        """
+        value = getattr(getattr(frame, self.page), self.field)
+        index = self.index if wheel is None else wheel
+        if index is not None:
+            value = value[index]
+        return value if self.convert is None else self.convert(value)
+
+
+class Channel:
+    """
+    One value that can be read from the game for a car, or for a tyre of a car.
+    """
+    __slots__ = ("name", "function", "state", "wheel", "extra", "transform", "returns", "shared", "doc")
+
+    def __init__(self, name: str, doc: str,
+        state: str = None,
+        function: str = "getCarState",
+        wheel: str = None,
+        extra: tuple = (),
+        transform = None,
+        returns = float,
+        shared: SharedField = None
+    ):
+        """
+        :param name: The name of the property.
+        :param doc: The docstring of the property.
+        :param state: The name of the acsys.CS constant, if the function takes one.
+        :param function: The name of the ac function that reads the value.
+        :param wheel: None for car channels, INDEX or ARGUMENT for tyre channels.
+        :param extra: Extra arguments after the state constant (and the wheel).
+        :param transform: A function applied to the value that was read, e.g. a conversion to bool.
+        :param returns: The type of the value.
+        :param shared: The shared memory equivalent of the channel, if any.
+        """
+        self.name = name
+        self.doc = doc
+        self.state = state
+        self.function = function
+        self.wheel = wheel
+        self.extra = tuple(extra)
+        self.transform = transform
+        self.returns = returns
+        self.shared = shared
+
+    @property
+    def is_vector(self) -> bool:
+        """
+        Check if the channel is a three component vector.
+        """
+        return self.returns is Vector3D
+
+    @property
+    def is_numeric(self) -> bool:
+        """
+        Check if the channel is a single number (or a vector), i.e. if it can be stored in an array.
+        """
+        return self.returns in (float, int, bool, Vector3D)
+
+    def reader(self, car_id: int, wheel: int = None, function = None) -> 'tuple':
+        """
+        Resolve how the channel is read for a car (and wheel).
+
+        :param function: The function to call instead of the ac function, e.g. a cached one.
+        :return: The function, its arguments, the wheel index into the result (or None)
+            and the transform (or None).
+        """
+        if function is None:
+            function = getattr(ac, self.function)
+        args = (car_id,)
+        if self.state is not None:
+            args += (getattr(acsys.CS, self.state),)
+        index = None
+        if self.wheel == ARGUMENT:
+            args += (wheel,)
+        elif self.wheel == INDEX:
+            index = wheel
+        return function, args + self.extra, index, self.transform
+
+    def _resolver(self, state_function) -> 'tuple[list, object]':
+        """
+        A list that is filled with the function, the constant and the extra arguments
+        on first use, and the function that fills it.
+        """
+        channel = self
+        resolved = []
+
+        def resolve():
+            function = state_function if channel.function == "getCarState" else getattr(ac, channel.function)
+            head = () if channel.state is None else (getattr(acsys.CS, channel.state),)
+            resolved[:] = [function, head, channel.extra]
+            return resolved
+
+        return resolved, resolve
+
+    def make_property(self, state_function) -> property:
+        """
+        Build the property of the Car or Tyre class for this channel.
+        The ac function and constants are resolved on first use, since some of them only exist
+        in newer versions of the game or with the Custom Shader Patch.
+
+        :param state_function: The function that is called instead of ac.getCarState.
+        """
+        transform = self.transform
+        resolved, resolve = self._resolver(state_function)
+
+        if self.wheel is None:
+            def get(self):
+                function, head, extra = resolved or resolve()
+                value = function(self._car_id, *head, *extra)
+                return value if transform is None else transform(value)
+        elif self.wheel == INDEX:
+            def get(self):
+                function, head, extra = resolved or resolve()
+                value = function(self._car_id, *head, *extra)[self._identifier]
+                return value if transform is None else transform(value)
+        else:
+            def get(self):
+                function, head, extra = resolved or resolve()
+                value = function(self._car_id, *head, self._identifier, *extra)
+                return value if transform is None else transform(value)
+
+        get.__name__ = self.name
+        get.__doc__ = self.doc
+        get.__annotations__ = {"return": self.returns}
+        return property(get, doc=self.doc)
+
+    def make_into(self, state_function):
+        """
+        Build the method of the Car or Tyre class that reads this vector channel into
+        a Vector3D owned by the caller, e.g. car.velocity_into(vector), so no new
+        vector is created. The method returns the vector.
+
+        :param state_function: The function that is called instead of ac.getCarState.
+        """
+        resolved, resolve = self._resolver(state_function)
+
+        if self.wheel is None:
+            def into(self, vector: Vector3D) -> Vector3D:
+                function, head, extra = resolved or resolve()
+                return vector.update(function(self._car_id, *head, *extra))
+        elif self.wheel == INDEX:
+            def into(self, vector: Vector3D) -> Vector3D:
+                function, head, extra = resolved or resolve()
+                return vector.update(function(self._car_id, *head, *extra)[self._identifier])
+        else:
+            def into(self, vector: Vector3D) -> Vector3D:
+                function, head, extra = resolved or resolve()
+                return vector.update(function(self._car_id, *head, self._identifier, *extra))
+
+        return self._name_into(into)
+
+    def _name_into(self, into):
+        into.__name__ = self.name + "_into"
+        into.__doc__ = "{}\nWritten into the given vector, which is returned.".format(self.doc)
+        return into
+
+    def make_shared_property(self, fallback: property, shared_frame) -> property:
+        """
+        Build a property that reads the channel from the shared memory, for the player car.
+
+        :param fallback: The property that reads the channel from the ac functions.
+        :param shared_frame: A function that returns the frame of pages to read,
+            or None to read with the fallback instead.
+        """
+        read = self.shared.read
+        fallback = fallback.fget
+        transform = self.transform if self.is_vector else None
+
+        if self.wheel is None:
+            def get(self):
+                frame = shared_frame()
+                if frame is None:
+                    return fallback(self)
+                value = read(frame)
+                return value if transform is None else transform(value)
+        else:
+            def get(self):
+                frame = shared_frame()
+                if frame is None:
+                    return fallback(self)
+                value = read(frame, self._identifier)
+                return value if transform is None else transform(value)
+
+        get.__name__ = self.name
+        get.__doc__ = self.doc
+        get.__annotations__ = {"return": self.returns}
+        return property(get, doc=self.doc)
+
+    def make_shared_into(self, fallback, shared_frame):
+        """
+        Build the method that reads this vector channel from the shared memory into
+        a Vector3D owned by the caller, for the player car.
+
+        :param fallback: The method that reads the channel from the ac functions.
+        :param shared_frame: A function that returns the frame of pages to read,
+            or None to read with the fallback instead.
+        """
+        page, field = self.shared.page, self.shared.field
+
+        if self.wheel is None:
+            def into(self, vector: Vector3D) -> Vector3D:
+                frame = shared_frame()
+                if frame is None:
+                    return fallback(self, vector)
+                return vector.update(getattr(getattr(frame, page), field))
+        else:
+            def into(self, vector: Vector3D) -> Vector3D:
+                frame = shared_frame()
+                if frame is None:
+                    return fallback(self, vector)
+                return vector.update(getattr(getattr(frame, page), field)[self._identifier])
+
+        return self._name_into(into)
+
+
+CAR_CHANNELS = (
+    Channel("speed_ms", "The speed of the car in meters per second.", "SpeedMS",
+            shared=SharedField("physics", "speedKmh", convert=_kmh_to_ms)),
+    Channel("speed_mph", "The speed of the car in miles per hour.", "SpeedMPH",
+            shared=SharedField("physics", "speedKmh", convert=_kmh_to_mph)),
+    Channel("speed_kmh", "The speed of the car in kilometers per hour.", "SpeedKMH",
+            shared=SharedField("physics", "speedKmh")),
+    Channel("throttle", "The gas pedal position.", "Gas",
+            shared=SharedField("physics", "gas")),
+    Channel("brake", "The brake pedal position.", "Brake",
+            shared=SharedField("physics", "brake")),
+    Channel("clutch", "The clutch pedal position.", "Clutch"),
+    Channel("gear", "The current gear of the car.", "Gear", returns=int,
+            shared=SharedField("physics", "gear")),
+    Channel("best_lap", "The best lap time of the car in milliseconds.", "BestLap",
+            shared=SharedField("graphics", "iBestTime")),
+    Channel("cg_height", "The height of the center of gravity of the car from the ground.", "CGHeight",
+            shared=SharedField("physics", "cgHeight")),
+    Channel("best_drift_lap", "The best lap points in drift mode.", "DriftBestLap"),
+    Channel("last_drift_lap", "The last lap points in drift mode.", "DriftLastLap"),
+    Channel("lap_drift_points", "The points of the current lap in drift mode.", "DriftPoints"),
+    Channel("drift_points", "The points of the current drift in drift mode.", "InstantDrift"),
+    Channel("drive_train_speed", "The speed of the drive train (speed delivered to the wheels).", "DriveTrainSpeed"),
+    Channel("rpm", "The current RPM of the car.", "RPM",
+            shared=SharedField("physics", "rpms")),
+    Channel("is_drift_invalid", "Check if the drift is invalid.", "IsDriftInvalid",
+            transform=_is_one, returns=bool),
+    Channel("is_engine_limiter_on", "Check if the engine limiter is on.", "IsEngineLimiterOn",
+            transform=_is_one, returns=bool),
+    Channel("lap_count", "The lap count of the car.", "LapCount", returns=int,
+            shared=SharedField("graphics", "completedLaps")),
+    Channel("is_lap_invalidated", "Check if the lap is invalidated.", "LapInvalidated",
+            transform=_is_one, returns=bool),
+    Channel("lap_time", "The lap time of the car in milliseconds.", "LapTime",
+            shared=SharedField("graphics", "iCurrentTime")),
+    Channel("last_lap_time", "The last lap time of the car in milliseconds.", "LastLap",
+            shared=SharedField("graphics", "iLastTime")),
+    Channel("normalized_spline_position", "The normalized position of the car on the track.", "NormalizedSplinePosition",
+            shared=SharedField("graphics", "normalizedCarPosition")),
+    Channel("performance_meter", "Projection of how many seconds is the current time far from\nthe current best lap",
+            "PerformanceMeter", shared=SharedField("physics", "performanceMeter")),
+    Channel("steer_rotation", "The radians of steer rotation.", "Steer"),
+    Channel("turbo_boost", "The turbo boost of the car.", "TurboBoost",
+            shared=SharedField("physics", "turboBoost")),
+    Channel("caster_angle", "The caster angle of the car in radians.", "Caster"),
+    Channel("gravity_acceleration", "The gravity acceleration on the vehicles center of gravity.", "AccG",
+            transform=_vector3, returns=Vector3D, shared=SharedField("physics", "accG")),
+    Channel("local_angular_velocity", "The angular velocity of the car, using the car as origin.", "LocalAngularVelocity",
+            transform=_vector3, returns=Vector3D, shared=SharedField("physics", "localAngularVel")),
+    Channel("local_velocity", "The velocity using the car as origin.", "LocalVelocity",
+            transform=_vector3, returns=Vector3D, shared=SharedField("physics", "localVelocity")),
+    Channel("speed_total", "The speed in all three units: km/h, mph, m/s.", "SpeedTotal",
+            transform=tuple, returns=tuple),
+    Channel("velocity", "The velocity of the car.", "Velocity",
+            transform=_vector3, returns=Vector3D, shared=SharedField("physics", "velocity")),
+    Channel("wheel_angular_speed", "The wheel angular velocity of the car.", "WheelAngularSpeed",
+            transform=_vector3, returns=Vector3D),
+    Channel("world_position", "Current Car Coordinates on map.", "WorldPosition",
+            transform=_vector3, returns=Vector3D, shared=SharedField("graphics", "carCoordinates")),
+    Channel("drs_available", "Check if the DRS (Drag Reduction System) is available, \ni.e. if the car is in a DRS zone.",
+            "DrsAvailable", transform=_is_one, returns=bool,
+            shared=SharedField("physics", "drsAvailable", convert=_is_one)),
+    Channel("drs_enabled", "Check if the DRS (Drag Reduction System) is enabled.", "DrsEnabled",
+            transform=_is_one, returns=bool, shared=SharedField("physics", "drsEnabled", convert=_is_one)),
+    Channel("spent_energy", "The spent energy of the car in Joule.", "ERSCurrentKJ",
+            transform=_kilo, shared=SharedField("physics", "kersCurrentKJ", convert=_kilo)),
+    Channel("ers_heat_charging_mode", "The ERS heat mode of the car.\n0 = Motor, 1 = Battery", "ERSHeatCharging",
+            returns=int, shared=SharedField("physics", "ersHeatCharging")),
+    Channel("max_ers_energy", "The maximum ERS energy of the car in Joule.", "ERSMaxJ"),
+    Channel("ers_recovery_level", "The ERS recovery level of the car", "ERSRecovery",
+            returns=int, shared=SharedField("physics", "ersRecoveryLevel")),
+    Channel("engine_brake_setting", "The current engine brake setting of the car.", "EngineBrake",
+            returns=int, shared=SharedField("physics", "engineBrake")),
+    Channel("battery_charge", "The KERS/ERS charge to the battery of the car. 0.0 to 1.0", "KersCharge",
+            shared=SharedField("physics", "kersCharge")),
+    Channel("engine_input", "The KERS/ERS input to the engine of the car. 0.0 to 1.0", "KersInput",
+            shared=SharedField("physics", "kersInput")),
+    Channel("last_ffb", "The last force feedback value.", "LastFF",
+            shared=SharedField("physics", "finalFF")),
+    Channel("finished_race", "Check if the car has finished the race.", "RaceFinished",
+            transform=_is_one, returns=bool),
+    Channel("front_ride_height", "The front ride height of the car in meters.", "RideHeight",
+            transform=_first, shared=SharedField("physics", "rideHeight", index=0)),
+    Channel("rear_ride_height", "The rear ride height of the car in meters.", "RideHeight",
+            transform=_second, shared=SharedField("physics", "rideHeight", index=1)),
+    Channel("drag_coefficient", "The drag coefficient of the car.", "Aero", extra=(0,)),
+    Channel("front_lift_coefficient", "The front lift coefficient of the car.", "Aero", extra=(1,)),
+    Channel("rear_lift_coefficient", "The rear lift coefficient of the car.", "Aero", extra=(2,)),
+    Channel("ers_delivery_mode", "The index of the ERS delivery mode.", "ERSDelivery", returns=int),
+    Channel("p2p_status", "The status index of the P2P (Push to Pass) system.\n"
+            "(I think it is: 0 = unavailable, 1 = cooldown, 2 = active, 3 = ready)", "P2PStatus", returns=int),
+    Channel("p2p_remaining", "How many P2P (Push to Pass) activations are remaining.", "P2PActivations", returns=int),
+    Channel("driver_name", "The name of the driver.", function="getDriverName", returns=str),
+    Channel("track_name", "The name of the track.", function="getTrackName", returns=str),
+    Channel("track_length", "The length of the track in meters.", function="getTrackLength"),
+    Channel("track_configuration_name", "The location of the track.", function="getTrackConfiguration", returns=str),
+    Channel("name", "The name of the car.", function="getCarName", returns=str),
+    Channel("last_lap_sectors", "The last splits of the car.", function="getLastSplits",
+            transform=tuple, returns=tuple),
+    Channel("is_car_in_pitlane", "Check if the car is in the pit lane.", function="isCarInPitlane",
+            transform=_is_one, returns=bool),
+    Channel("is_car_in_pit", "Check if the car is in the pit.", function="isCarInPit",
+            transform=_is_one, returns=bool),
+    Channel("is_connected", "Check if the car is connected.", function="isConnected",
+            transform=_is_one, returns=bool),
+    Channel("ballast", "The car ballast value.", function="getCarBallast"),
+    Channel("minimum_height", "The car minimum height.", function="getCarMinHeight"),
+    Channel("leaderboard_position", "The car leaderboard position.", function="getCarLeaderboardPosition", returns=int),
+    Channel("real_time_leaderboard_position", "The car real time leaderboard position.",
+            function="getCarRealTimeLeaderboardPosition", returns=int),
+    Channel("skin_name", "The skin name of the car.", function="getCarSkin", returns=str),
+    Channel("driver_nation_code", "The nation code of the driver.", function="getDriverNationCode", returns=str),
+    Channel("current_lap_sectors", "The current sectors of the car in milliseconds.", function="getCurrentSplits",
+            transform=tuple, returns=tuple),
+    Channel("is_ai_controlled", "Check if the car is controlled by AI.", function="isAIControlled",
+            transform=_is_one, returns=bool),
+    Channel("tyre_compound", "The tyre compound of the car.", function="getCarTyreCompound", returns=str),
+    Channel("restrictor", "The restrictor of the car in percentage.", function="getCarRestrictor"),
+    Channel("num_engine_brake_settings", "The number of engine brake settings available for the car.",
+            function="getCarEngineBrakeCount", returns=int),
+    Channel("num_ers_power_controller_settings", "The number of ERS power controller settings available for the car.",
+            function="getCarPowerControllerCount", returns=int),
+)
+
+TYRE_CHANNELS = (
+    Channel("camber_radians", "The camber angle of the tyre in radians.", "CamberRad", wheel=INDEX,
+            shared=SharedField("physics", "camberRAD")),
+    Channel("camber_degrees", "The camber angle of the tyre in degrees.", "CamberDeg", wheel=INDEX),
+    Channel("slip_angle", "The slip angle of the tyre in degrees.", "SlipAngle", wheel=INDEX),
+    Channel("slip_ratio", "The slip ratio of the tyre.", "SlipRatio", wheel=INDEX),
+    Channel("self_aligning_torque", "The self-aligning torque of the tyre.", "Mz", wheel=INDEX),
+    Channel("load", "The load on the tyre in Newtons.", "Load", wheel=INDEX,
+            shared=SharedField("physics", "wheelLoad")),
+    Channel("radius", "The radius of the tyre in meters.", "TyreRadius", wheel=INDEX),
+    Channel("nd_slip", "How far the tyre is from optimal slip angle.", "NdSlip", wheel=INDEX),
+    Channel("tyre_slip", "The tyre slip.", "TyreSlip", wheel=INDEX,
+            shared=SharedField("physics", "wheelSlip")),
+    Channel("dy", "I honeslty don't know what this is.", "DY", wheel=INDEX),
+    Channel("temperature", "The temperature of the tyre.", "TyreTemp", wheel=ARGUMENT),
+    Channel("core_temperature", "The core temperature of the tyre in degrees Celsius.", "CurrentTyresCoreTemp",
+            wheel=INDEX, shared=SharedField("physics", "tyreCoreTemperature")),
+    Channel("dynamic_pressure", "The dynamic pressure of the tyre in PSI.", "DynamicPressure", wheel=INDEX,
+            shared=SharedField("physics", "wheelsPressure")),
+    Channel("loaded_radius", "The loaded radius of the tyre in meters.", "TyreLoadedRadius", wheel=INDEX),
+    Channel("suspension_travel", "The suspension travel of the tyre in meters.", "SuspensionTravel", wheel=INDEX,
+            shared=SharedField("physics", "suspensionTravel")),
+    Channel("dirt_level", "The dirt level of the tyre.", "TyreDirtyLevel", wheel=INDEX,
+            shared=SharedField("physics", "tyreDirtyLevel")),
+    Channel("tyre_contact_point", "The tyre contact point of the tyre.", "TyreContactPoint", wheel=ARGUMENT,
+            transform=_vector3, returns=Vector3D),
+    Channel("tyre_contact_normal", "The tyre contact normal of the tyre.", "TyreContactNormal", wheel=ARGUMENT,
+            transform=_vector3, returns=Vector3D),
+    Channel("tyre_contact_heading", "The tyre contact heading of the tyre.", "TyreHeadingVector", wheel=ARGUMENT,
+            transform=_vector3, returns=Vector3D),
+    Channel("toe", "The toe angle of the tyre in degrees.", "ToeInDeg", wheel=ARGUMENT),
+    Channel("last_tyres_temperature", "I think this is supposed to do the same as tyre_temperature in the PlayerTyre class,\n"
+            "but from testing I can't get any sensible values from it. So use at own risk I guess.",
+            "LastTyresTemp", wheel=ARGUMENT, transform=tuple, returns=tuple),
+    Channel("slip_angle_contact_patch", "The slip angle of the tyre at the contact patch.", "SlipAngleContactPatch",
+            wheel=INDEX),
+    Channel("tyre_wear", "The wear of the tyre.", function="ext_getTyreWear", wheel=ARGUMENT),
+    Channel("brake_temperature", "The brake temperature of the tyre in degrees Celsius.",
+            function="ext_getBrakeTemp", wheel=ARGUMENT, shared=SharedField("physics", "brakeTemp")),
+    Channel("inner_surface_temperature", "The inner surface temperature of the tyre in degrees Celsius.",
+            function="ext_getTyreTempI", wheel=ARGUMENT, shared=SharedField("physics", "tyreTempI")),
+    Channel("middle_surface_temperature", "The middle surface temperature of the tyre in degrees Celsius.",
+            function="ext_getTyreTempM", wheel=ARGUMENT, shared=SharedField("physics", "tyreTempM")),
+    Channel("outer_surface_temperature", "The outer surface temperature of the tyre in degrees Celsius.",
+            function="ext_getTyreTempO", wheel=ARGUMENT, shared=SharedField("physics", "tyreTempO")),
+)
+
+_CAR_CHANNELS_BY_NAME = {channel.name: channel for channel in CAR_CHANNELS}
+_TYRE_CHANNELS_BY_NAME = {channel.name: channel for channel in TYRE_CHANNELS}
+
+
+def car_channel(name: str) -> Channel:
+    """
+    Look up a car channel by the name of its property.
+    """
+    try:
+        return _CAR_CHANNELS_BY_NAME[name]
+    except KeyError:
+        raise ValueError("Unknown car channel: '{}'.".format(name))
+
+
+def tyre_channel(name: str) -> Channel:
+    """
+    Look up a tyre channel by the name of its property.
+    """
+    try:
+        return _TYRE_CHANNELS_BY_NAME[name]
+    except KeyError:
+        raise ValueError("Unknown tyre channel: '{}'.".format(name))
+
+
+def install(cls, channels: 'tuple[Channel]', state_function) -> None:
+    """
+    Add a property for every channel to a class, and a <name>_into method for every vector channel.
+
+    :param state_function: The function that is called instead of ac.getCarState.
+    """
+    for channel in channels:
+        setattr(cls, channel.name, channel.make_property(state_function))
+        if channel.is_vector:
+            setattr(cls, channel.name + "_into", channel.make_into(state_function))
+
+
+def install_shared(cls, channels: 'tuple[Channel]', shared_frame) -> None:
+    """
+    Override the properties of the channels that are in the shared memory, on a subclass
+    for the player car.
+
+    :param shared_frame: A function that returns the frame of pages to read, or None
+        to read from the ac functions instead.
+    """
+    for channel in channels:
+        if channel.shared is not None:
+            fallback = getattr(cls, channel.name)
+            setattr(cls, channel.name, channel.make_shared_property(fallback, shared_frame))
+            if channel.is_vector:
+                fallback = getattr(cls, channel.name + "_into")
+                setattr(cls, channel.name + "_into", channel.make_shared_into(fallback, shared_frame))
@@ -1,7 +1,7 @@
 import ac
 import acsys
 
-from .graphics import Color
+from .graphics import Color, WHITE, BLACK, texture_key
 from .font import FontAlignment, Font
 from . import *
 
@@ -26,6 +26,7 @@ class _GenericElement:
         self.position = position
         self.background_opacity = background_opacity
         self.border_visible = border_visible
+        self.background_texture = None
         if background_texture is not None:
             self.set_background_texture_path(background_texture)
         self.font_alignment = font_alignment
@@ -105,7 +106,11 @@ class _GenericElement:
     def set_background_texture_path(self, path: str):
         """
         Set the background texture path of the element. Path starts from the assettocorsa root folder.
+        The path is only sent to AC when it names another file than the current one.
         """
+        current = self.background_texture
+        if path == current or (path is not None and current is not None and texture_key(path) == texture_key(current)):
+            return
         self.background_texture = path
         if path is not None:
             ac.setBackgroundTexture(self._object_id, path)
@@ -213,7 +218,7 @@ class AppWindow(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        font_color: Color = Color(255, 255, 255, 1),
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         title_position = (0, 0),
@@ -338,8 +343,8 @@ class Button(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        background_color: Color = Color(0, 0, 0, 1),
-        font_color: Color = Color(255, 255, 255, 1),
+        background_color: Color = BLACK,
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         font = Font(),
@@ -409,7 +414,7 @@ class Graph(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        font_color: Color = Color(255, 255, 255, 1),
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         font = Font()
@@ -515,7 +520,7 @@ class Checkbox(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        font_color: Color = Color(255, 255, 255, 1),
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         font = Font(),
@@ -569,7 +574,7 @@ class Spinner(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        font_color: Color = Color(255, 255, 255, 1),
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         font = Font(),
@@ -671,7 +676,7 @@ class ProgressBar(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        font_color: Color = Color(255, 255, 255, 1),
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         font = Font()
@@ -733,7 +738,7 @@ class TextInput(_GenericElement):
         border_visible: bool = True,
         background_texture: str = None,
         font_alignment: FontAlignment = FontAlignment.CENTER,
-        font_color: Color = Color(255, 255, 255, 1),
+        font_color: Color = WHITE,
         visible: bool = True,
         font_size: int = 12,
         font = Font(),
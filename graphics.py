@@ -1,5 +1,11 @@
 import ac
 import acsys
+import math
+import ntpath
+import weakref
+import functools
+from array import array
+from collections import deque
 
 from .vectors import Vector2D
 from .better_ac import log
@@ -10,49 +16,194 @@ GL_TRIANGLES = 2
 GL_QUADS = 3
 
 
+class _Watched:
+    """
+    A base class for the mutable parts of a shape. Setting an attribute invalidates
+    the compiled streams of the shapes that use the object.
+    """
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        shapes = self.__dict__.get("_shapes")
+        if shapes:
+            for shape in list(shapes):
+                shape._compiled.clear()
+
+    def _watch(self, shape: 'Shape') -> None:
+        shapes = self.__dict__.get("_shapes")
+        if shapes is None:
+            shapes = weakref.WeakSet()
+            object.__setattr__(self, "_shapes", shapes)
+        shapes.add(shape)
+
+
 class Color:
     """
-    A class to represent colors in RGB(A) format.
+    A class to represent colors in RGB(A) format. Colors are immutable, so the same object
+    can be shared freely, e.g. as a default argument. The tuples in the format used by AC
+    are computed once, and equal colors are interned (up to a limit), so Color(255, 255, 255)
+    returns the same object every time.
     """
+    __slots__ = ("red", "green", "blue", "alpha", "_rgb", "_rgba")
+
+    _instances = {}
+    _MAX_INSTANCES = 1024
 
-    def __init__(self, red: int, green: int, blue: int, alpha: float = 1):
+    def __new__(cls, red: int, green: int, blue: int, alpha: float = 1):
         """
         Initialize the color with red, green, blue, and alpha values.
         """
+        key = (red, green, blue, alpha)
+        instance = Color._instances.get(key)
+        if instance is not None:
+            return instance
         if not (0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255):
             raise ValueError("RGB values must be between 0 and 255.")
         if not (0 <= alpha <= 1):
             raise ValueError("Alpha value must be between 0 and 1.")
+        instance = super().__new__(cls)
+        rgb = (red / 255, green / 255, blue / 255)
+        for name, value in zip(Color.__slots__, (red, green, blue, alpha, rgb, rgb + (alpha,))):
+            object.__setattr__(instance, name, value)
+        if len(Color._instances) < Color._MAX_INSTANCES:
+            Color._instances[key] = instance
+        return instance
 
-        self.red = red
-        self.green = green
-        self.blue = blue
-        self.alpha = alpha
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Colors are immutable, create a new Color instead.")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Color):
+            return NotImplemented
+        return self._rgba == other._rgba
+
+    def __hash__(self) -> int:
+        return hash(self._rgba)
+
+    def __reduce__(self):
+        # copy and pickle go through __new__, which needs the channels.
+        return Color, (self.red, self.green, self.blue, self.alpha)
+
+    def __repr__(self) -> str:
+        return "Color({}, {}, {}, {})".format(self.red, self.green, self.blue, self.alpha)
 
-    
     def ac_rgb(self) -> 'tuple[float, float, float]':
         """
         Converts the RGB parts of the color to the format used by the AC.
         """
-        return self.red / 255, self.green / 255, self.blue / 255
-    
+        return self._rgb
+
     def ac_rgba(self) -> 'tuple[float, float, float, float]':
         """
         Converts the RGBA parts of the color to the format used by the AC.
         """
-        return self.red / 255, self.green / 255, self.blue / 255, self.alpha
+        return self._rgba
+
+
+WHITE = Color(255, 255, 255)
+BLACK = Color(0, 0, 0)
+
+
+class ColorMap:
+    """
+    Maps a value, e.g. a tyre temperature, to a color through a table that is computed once.
+    The colors between the stops are interpolated linearly, values outside the stops get
+    the color of the first or last stop.
+    """
+    __slots__ = ("minimum", "maximum", "_scale", "_colors")
+
+    def __init__(self, stops: 'list[tuple[float, Color]]', size: int = 256):
+        """
+        :param stops: The values and their colors, e.g. [(60, blue), (90, green), (110, red)].
+        :param size: The number of colors in the table.
+        """
+        if len(stops) < 2 or size < 2:
+            raise ValueError("A ColorMap needs at least 2 stops and 2 colors.")
+        stops = sorted(stops, key=lambda stop: stop[0])
+        self.minimum = stops[0][0]
+        self.maximum = stops[-1][0]
+        if self.maximum == self.minimum:
+            raise ValueError("The stops of a ColorMap must cover a range of values.")
+        self._scale = (size - 1) / (self.maximum - self.minimum)
+        colors = []
+        stop = 0
+        for index in range(size):
+            value = self.minimum + index / self._scale
+            while stop < len(stops) - 2 and value > stops[stop + 1][0]:
+                stop += 1
+            (low, first), (high, second) = stops[stop], stops[stop + 1]
+            t = 0.0 if high == low else min(1.0, max(0.0, (value - low) / (high - low)))
+            colors.append(Color(
+                round(first.red + (second.red - first.red) * t),
+                round(first.green + (second.green - first.green) * t),
+                round(first.blue + (second.blue - first.blue) * t),
+                first.alpha + (second.alpha - first.alpha) * t
+            ))
+        self._colors = tuple(colors)
+
+    def __call__(self, value: float) -> Color:
+        """
+        The color of a value.
+        """
+        index = int((value - self.minimum) * self._scale + 0.5)
+        if index <= 0:
+            return self._colors[0]
+        if index >= len(self._colors):
+            return self._colors[-1]
+        return self._colors[index]
+
+
+def texture_key(path: str) -> str:
+    """
+    The normalized form of a texture path, equal for all spellings of the same file
+    (slashes, "..", case, since the game runs on Windows).
+    """
+    return ntpath.normcase(ntpath.normpath(path))
 
 
 class Texture:
     """
-    A class to handle textures in Assetto Corsa.
+    A class to handle textures in Assetto Corsa. Textures are shared: Texture(path) loads
+    a file with ac.newTexture only once and returns the same object for every path of that
+    file, counting a reference. Call release() when the texture is no longer used.
+
+    AC has no function to delete a texture, so a texture stays loaded for the whole session
+    even when it is no longer referenced. Its handle is kept as well, so using the file
+    again never loads a second copy.
     """
-    def __init__(self, path: str):
-        self.path = path
-        self.texture_id = ac.newTexture(path)
+    __slots__ = ("path", "texture_id", "_key", "_references")
+
+    _loaded = {}
+
+    def __new__(cls, path: str):
+        key = texture_key(path)
+        texture = Texture._loaded.get(key)
+        if texture is None:
+            texture = super().__new__(cls)
+            texture.path = path
+            texture.texture_id = ac.newTexture(path)
+            texture._key = key
+            texture._references = 0
+            Texture._loaded[key] = texture
+        texture._references += 1
+        return texture
+
+    @property
+    def references(self) -> int:
+        """
+        The number of users of the texture, i.e. Texture(path) calls minus release() calls.
+        """
+        return self._references
+
+    def release(self) -> None:
+        """
+        Drop a reference to the texture. The texture stays loaded, see Texture.
+        """
+        if self._references == 0:
+            raise ValueError("The texture '{}' is not referenced.".format(self.path))
+        self._references -= 1
 
 
-class Vertex:
+class Vertex(_Watched):
     def __init__(self, x: float, y: float, color: Color):
         """
         Initialize a vertex with x, y coordinates and a color.
@@ -72,6 +223,25 @@ class Vertex:
         return Vector2D(self.x, self.y)
 
 
+def _draw_vertices(mode: int, vertices: 'list[Vertex]') -> None:
+    """
+    Draw vertices inside one glBegin/glEnd pair, setting the color only when it changes.
+    """
+    if not vertices:
+        return
+    gl_color = ac.glColor4f
+    gl_vertex = ac.glVertex2f
+    last = None
+    ac.glBegin(mode)
+    for vertex in vertices:
+        color = vertex.color.ac_rgba()
+        if color != last:
+            gl_color(*color)
+            last = color
+        gl_vertex(vertex.x, vertex.y)
+    ac.glEnd()
+
+
 class Drawable:
     """
     A base class for drawable objects.
@@ -101,7 +271,7 @@ class Line(Drawable):
         ac.glEnd()
 
 
-class Triangle(Drawable):
+class Triangle(Drawable, _Watched):
     def __init__(self, v1: Vertex, v2: Vertex, v3: Vertex):
         """
         Initialize a triangle with three vertices.
@@ -156,78 +326,254 @@ class Triangle(Drawable):
         ac.glEnd()
 
 
+def triangulate(points: 'list[Vector2D]') -> 'tuple[int, ...]':
+    """
+    Triangulate a simple polygon (no holes, no crossing edges) given by its corners in either
+    winding order. Returns an index buffer: three indices into points per triangle, in the
+    winding order of the polygon. The results of the last polygons are cached by their
+    coordinates, so triangulating the same polygon again is a lookup.
+
+    Crossing edges or holes don't raise, but the triangles may then overlap.
+
+    :param points: The corners, any objects with x and y, e.g. Vector2D or Vertex.
+    """
+    if len(points) < 3:
+        raise ValueError("A polygon must have at least 3 vertices.")
+    coordinates = []
+    for point in points:
+        coordinates.append(point.x)
+        coordinates.append(point.y)
+    return _triangulate(tuple(coordinates))
+
+
+@functools.lru_cache(maxsize=64)
+def _triangulate(coordinates: 'tuple[float, ...]') -> 'tuple[int, ...]':
+    """
+    Ear clipping over a doubly linked ring of the corners. The reflex corners are kept in a set,
+    and in a grid of buckets so that an ear candidate is only tested against the reflex corners
+    near it. Clipping an ear can only make its neighbours convex, so the set only shrinks,
+    and only the neighbours of a clipped ear need to be tested again.
+    """
+    xs = coordinates[0::2]
+    ys = coordinates[1::2]
+    count = len(xs)
+    area = sum(xs[i - 1] * ys[i] - xs[i] * ys[i - 1] for i in range(count))
+    orientation = 1.0 if area >= 0 else -1.0
+    previous = [i - 1 for i in range(count)]
+    previous[0] = count - 1
+    following = [i + 1 for i in range(count)]
+    following[-1] = 0
+
+    def turn(a: int, b: int, c: int) -> float:
+        # Positive if a, b, c turn the same way as the polygon.
+        return ((xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])) * orientation
+
+    min_x, min_y = min(xs), min(ys)
+    size = max(max(xs) - min_x, max(ys) - min_y) / max(1, int(math.sqrt(count))) or 1.0
+
+    def cell(i: int) -> 'tuple[int, int]':
+        return int((xs[i] - min_x) / size), int((ys[i] - min_y) / size)
+
+    reflex = set()
+    grid = {}
+    for i in range(count):
+        if turn(previous[i], i, following[i]) <= 0:
+            reflex.add(i)
+            grid.setdefault(cell(i), set()).add(i)
+
+    def is_ear(b: int) -> bool:
+        a, c = previous[b], following[b]
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+        left, right = min(ax, bx, cx), max(ax, bx, cx)
+        bottom, top = min(ay, by, cy), max(ay, by, cy)
+        corners = ((ax, ay), (bx, by), (cx, cy))
+        x0, y0 = cell(a)
+        x1, y1 = cell(b)
+        x2, y2 = cell(c)
+        for column in range(min(x0, x1, x2), max(x0, x1, x2) + 1):
+            for row in range(min(y0, y1, y2), max(y0, y1, y2) + 1):
+                for p in grid.get((column, row), ()):
+                    px, py = xs[p], ys[p]
+                    if px < left or px > right or py < bottom or py > top:
+                        continue
+                    if ((bx - ax) * (py - ay) - (by - ay) * (px - ax)) * orientation < 0:
+                        continue
+                    if ((cx - bx) * (py - by) - (cy - by) * (px - bx)) * orientation < 0:
+                        continue
+                    if ((ax - cx) * (py - cy) - (ay - cy) * (px - cx)) * orientation < 0:
+                        continue
+                    if (px, py) not in corners:
+                        return False
+        return True
+
+    # The convex corners to test, in ring order. A corner that is not an ear is dropped until
+    # a neighbour is clipped; when the queue runs dry, all convex corners are queued again.
+    removed = bytearray(count)
+    candidates = deque(i for i in range(count) if i not in reflex)
+    indices = []
+    remaining = count
+    start = 0
+    progress = True
+    forced = -1
+    skipped = -1
+    while remaining > 3:
+        if not candidates:
+            if progress:
+                i = start
+                while True:
+                    if i not in reflex:
+                        candidates.append(i)
+                    i = following[i]
+                    if i == start:
+                        break
+            if not progress or not candidates:
+                # No ear left, the polygon is degenerate or not simple: clip a corner anyway.
+                forced = start
+                candidates.append(start)
+            progress = False
+            skipped = -1
+        b = candidates.popleft()
+        if removed[b]:
+            continue
+        if b == skipped:
+            # The corner after a clipped ear is tested later (it was queued again), so that
+            # every other corner is clipped instead of a fan of long triangles around one corner.
+            skipped = -1
+            continue
+        if b != forced and (b in reflex or not is_ear(b)):
+            continue
+        if b in reflex:
+            reflex.discard(b)
+            grid[cell(b)].discard(b)
+        a, c = previous[b], following[b]
+        indices.extend((a, b, c))
+        following[a] = c
+        previous[c] = a
+        removed[b] = 1
+        remaining -= 1
+        progress = True
+        forced = -1
+        skipped = c
+        for neighbour in (a, c):
+            if neighbour in reflex and turn(previous[neighbour], neighbour, following[neighbour]) > 0:
+                reflex.discard(neighbour)
+                grid[cell(neighbour)].discard(neighbour)
+            if neighbour not in reflex:
+                candidates.append(neighbour)
+        start = c
+    indices.extend((previous[start], start, following[start]))
+    return tuple(indices)
+
+
+class CompiledShape(Drawable):
+    """
+    The geometry of a shape flattened into packed buffers: x, y of every vertex in positions
+    and r, g, b, a in colors. Consecutive vertices with the same color form a run, so
+    drawing sets each color once and then only sends positions.
+    """
+    __slots__ = ("mode", "positions", "colors", "_runs")
+
+    def __init__(self, mode: int, vertices: 'list[Vertex]'):
+        """
+        :param mode: The GL primitive type, e.g. GL_TRIANGLES.
+        :param vertices: The vertices in drawing order.
+        """
+        self.mode = mode
+        self.positions = array("f")
+        self.colors = array("f")
+        runs = []
+        last = None
+        for index, vertex in enumerate(vertices):
+            self.positions.extend((vertex.x, vertex.y))
+            color = vertex.color.ac_rgba()
+            self.colors.extend(color)
+            if color != last:
+                runs.append([2 * index, 2 * index] + list(color))
+                last = color
+            runs[-1][1] = 2 * index + 2
+        self._runs = tuple(tuple(run) for run in runs)
+
+    def __len__(self) -> int:
+        """
+        The number of vertices.
+        """
+        return len(self.positions) // 2
+
+    def draw(self):
+        if not self.positions:
+            return
+        positions = self.positions
+        gl_color = ac.glColor4f
+        gl_vertex = ac.glVertex2f
+        ac.glBegin(self.mode)
+        for start, end, red, green, blue, alpha in self._runs:
+            gl_color(red, green, blue, alpha)
+            for x, y in zip(positions[start:end:2], positions[start + 1:end:2]):
+                gl_vertex(x, y)
+        ac.glEnd()
+
+
 class Shape(Drawable):
     """A base class for shapes that can be drawn."""
     def __init__(self, vertices: 'list[Vertex]', triangles: 'list[Triangle]'):
         self.vertices = vertices
         self.triangles = triangles
+        # The compiled streams by fill mode, and the lists they were compiled from.
+        self._compiled = {}
+        self._sources = None
+
+    def compile(self, fill: bool = True) -> CompiledShape:
+        """
+        Flatten the shape into packed buffers once, see CompiledShape. The result is cached
+        and draw() uses it. It is compiled again only after a vertex or triangle of the shape
+        was changed (e.g. a new color), or after the vertex or triangle lists were changed.
+
+        :param fill: If True, the triangles are compiled, otherwise the outline.
+        """
+        sources = self._sources
+        if sources is None or sources[0] != self.vertices or sources[1] != self.triangles:
+            self._compiled.clear()
+            self._sources = (list(self.vertices), list(self.triangles))
+        compiled = self._compiled.get(fill)
+        if compiled is None:
+            if fill:
+                vertices = []
+                for triangle in self.triangles:
+                    triangle._watch(self)
+                    vertices.extend((triangle.v1, triangle.v2, triangle.v3))
+                compiled = CompiledShape(GL_TRIANGLES, vertices)
+            else:
+                vertices = self.vertices
+                compiled = CompiledShape(GL_LINES_STRIP, vertices)
+            for vertex in vertices:
+                vertex._watch(self)
+            self._compiled[fill] = compiled
+        return compiled
 
-    # DOESN'T REALLY WORK YET
     @staticmethod
     def polygon(points: 'list[Vector2D]', color: Color) -> 'Shape':
         """
-        Create a shape from a list of vertices by converting them into triangles.
-        
+        Create a shape from the corners of a simple polygon (no holes, no crossing edges),
+        in either winding order, by triangulating it, see triangulate().
+
         :param points: A list of Vector2D objects representing the corners of the polygon.
+        :param color: The color of the polygon.
         :return: A Shape object containing the triangles that make up the polygon.
         """
-        if len(points) < 3:
-            raise ValueError("A polygon must have at least 3 vertices.")
-        triangles = []
-        indices = list(range(len(points)))
-        i = 0
-        while len(indices) > 3:
-            if i == len(indices):
-                break
-            i1 = indices[i-1]
-            i2 = indices[i]
-            i3 = indices[(i + 1) % len(indices)]
-            p1, p2, p3 = points[i1], points[i2], points[i3]
-            triangle = Triangle(
-                Vector2D(p1.x, p1.y, color), 
-                Vector2D(p2.x, p2.y, color),
-                Vector2D(p3.x, p3.y, color)
-            )
-            if not triangle.is_convex():
-                i += 1
-                continue
-            ear_found = True
-            for j in indices:
-                if j in (i1, i2, i3):
-                    continue
-                if triangle.is_inside(points[j].vector()):
-                    ear_found = False
-                    break
-            if ear_found:
-                triangles.append(triangle)
-                indices.pop(i)
-                i = 0
-            else:
-                i += 1
-        if len(indices) == 3:
-            p1, p2, p3 = [points[i] for i in indices]
-            triangles.append(
-                triangle = Triangle(
-                    Vector2D(p1.x, p1.y, color), 
-                    Vector2D(p2.x, p2.y, color),
-                    Vector2D(p3.x, p3.y, color)
-                )
-            )
-        return Shape(points, triangles)
+        indices = triangulate(points)
+        vertices = [Vertex(point.x, point.y, color) for point in points]
+        triangles = [
+            Triangle(vertices[indices[i]], vertices[indices[i + 1]], vertices[indices[i + 2]])
+            for i in range(0, len(indices), 3)
+        ]
+        return Shape(vertices, triangles)
 
     def draw(self, fill: bool = True):
         """
-        Draw the shape by rendering all triangles.
+        Draw the shape by rendering all triangles, or the outline if fill is False.
+        The compiled stream is used, see compile().
         """
-        if fill:
-            for triangle in self.triangles:
-                triangle.draw()
-            return
-        ac.glBegin(GL_LINES_STRIP)
-        for vertex in self.vertices:
-            ac.glColor4f(*vertex.color.ac_rgba())
-            ac.glVertex2f(vertex.x, vertex.y)
-        ac.glEnd()
+        self.compile(fill).draw()
 
 
 class Quad(Drawable):
@@ -278,3 +624,62 @@ class TexturedQuad(Drawable):
     def draw(self):
         ac.glQuadTextured(self.x, self.y, self.width, self.height, self.texture.texture_id)
 
+
+
+class DrawList(Drawable):
+    """
+    Collects lines, triangles and quads and draws them grouped by primitive type, with one
+    glBegin/glEnd pair per type and a color call only when the color changes between vertices.
+    Build it once for static geometry, or clear() and refill it every frame.
+    The primitives are drawn in the order lines, triangles, quads, so overlapping primitives
+    of different types should go into different draw lists.
+    """
+    def __init__(self):
+        self._groups = {GL_LINES: [], GL_TRIANGLES: [], GL_QUADS: []}
+
+    def add_line(self, start: Vertex, end: Vertex) -> None:
+        self._groups[GL_LINES].extend((start, end))
+
+    def add_triangle(self, v1: Vertex, v2: Vertex, v3: Vertex) -> None:
+        self._groups[GL_TRIANGLES].extend((v1, v2, v3))
+
+    def add_quad(self, x: float, y: float, width: float, height: float, color: Color) -> None:
+        """
+        Add a quad with its top-left corner at x, y.
+        """
+        self._groups[GL_QUADS].extend((
+            Vertex(x, y, color),
+            Vertex(x, y + height, color),
+            Vertex(x + width, y + height, color),
+            Vertex(x + width, y, color)
+        ))
+
+    def add(self, drawable: Drawable) -> None:
+        """
+        Add a Line, Triangle, Quad or the triangles of a filled Shape.
+        """
+        if isinstance(drawable, Line):
+            self.add_line(drawable.start, drawable.end)
+        elif isinstance(drawable, Triangle):
+            self.add_triangle(drawable.v1, drawable.v2, drawable.v3)
+        elif isinstance(drawable, Quad):
+            self.add_quad(drawable.x, drawable.y, drawable.width, drawable.height, drawable.color)
+        elif isinstance(drawable, Shape):
+            for triangle in drawable.triangles:
+                self.add_triangle(triangle.v1, triangle.v2, triangle.v3)
+        else:
+            raise ValueError("Only lines, triangles, quads and shapes can be added to a DrawList.")
+
+    def clear(self) -> None:
+        for vertices in self._groups.values():
+            vertices.clear()
+
+    def __len__(self) -> int:
+        """
+        The number of vertices in the list.
+        """
+        return sum(len(vertices) for vertices in self._groups.values())
+
+    def draw(self):
+        for mode, vertices in self._groups.items():
+            _draw_vertices(mode, vertices)
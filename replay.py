@@ -0,0 +1,91 @@
+"""
+Replay of recorded telemetry into a stand-in for the shared memory of the game.
+"""
+import time
+import ctypes
+
+from .sim_info import SharedMemoryBackend, SPageFilePhysics, SPageFileGraphic, SPageFileStatic, default_backend
+from .telemetry import TelemetryFile, FRAME_SIZE, FRAME_TIME, PHYSICS_OFFSET, GRAPHICS_OFFSET, PHYSICS_SIZE, GRAPHICS_SIZE, STATIC_SIZE
+
+
+class TelemetryReplay:
+    """
+    Writes the frames of a recorded session back into the acpmf_* pages, so SimInfo
+    and everything built on it (PlayerCar, session.current_flag, ...) runs unmodified
+    against real data. With a FileBackend the pages can be read by any process that
+    maps the same directory, e.g. SimInfo(FileBackend(directory)).
+    """
+
+    def __init__(self, path: str, backend: SharedMemoryBackend = None, speed: float = 1.0):
+        """
+        :param path: The path of a file written by TelemetryRecorder.
+        :param backend: Where the pages are written, the default_backend() if None.
+        :param speed: The playback speed multiplier, 1.0 is real time and None is unthrottled.
+        :raises ValueError: If the file was recorded with a different page layout, see TelemetryFile.check_layout().
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("Speed must be greater than 0.")
+        self.speed = speed
+        self._file = TelemetryFile(path)
+        try:
+            self._file.check_layout()
+        except ValueError:
+            self._file.close()
+            raise
+        self.backend = default_backend() if backend is None else backend
+        self._physics = self.backend.open("acpmf_physics", ctypes.sizeof(SPageFilePhysics))
+        self._graphics = self.backend.open("acpmf_graphics", ctypes.sizeof(SPageFileGraphic))
+        self._static = self.backend.open("acpmf_static", ctypes.sizeof(SPageFileStatic))
+        self.frames_written = 0
+        self._stopped = False
+
+    def stop(self) -> None:
+        """
+        Stop a replay that is running in another thread after the current frame.
+        """
+        self._stopped = True
+
+    def run(self, on_frame = None) -> int:
+        """
+        Replay the whole session.
+
+        :param on_frame: A function that is called with the frame index after each frame is written.
+        :return: The number of frames written.
+        """
+        self._stopped = False
+        self._static[:STATIC_SIZE] = bytes(self._file.static)
+        speed = self.speed
+        sleep = time.sleep
+        clock = time.perf_counter
+        start = None
+        for chunk in range(len(self._file.chunks)):
+            rows = self._file.rows(chunk)
+            for offset in range(0, len(rows), FRAME_SIZE):
+                if self._stopped:
+                    return self.frames_written
+                if speed is not None:
+                    recorded = FRAME_TIME.unpack_from(rows, offset)[0]
+                    if start is None:
+                        start = (clock(), recorded)
+                    wait = start[0] + (recorded - start[1]) / speed - clock()
+                    if wait > 0:
+                        sleep(wait)
+                # The graphics page goes first, so a reader woken by the physics packetId sees both.
+                self._graphics[:GRAPHICS_SIZE] = rows[offset + GRAPHICS_OFFSET:offset + GRAPHICS_OFFSET + GRAPHICS_SIZE]
+                self._physics[:PHYSICS_SIZE] = rows[offset + PHYSICS_OFFSET:offset + PHYSICS_OFFSET + PHYSICS_SIZE]
+                if on_frame is not None:
+                    on_frame(self.frames_written)
+                self.frames_written += 1
+        return self.frames_written
+
+    def close(self) -> None:
+        self._file.close()
+        self._physics.close()
+        self._graphics.close()
+        self._static.close()
+
+    def __enter__(self) -> 'TelemetryReplay':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -1,4 +1,4 @@
-from sim_info import info
+from .sim_info import info
 
 
 class Session:
@@ -38,11 +38,19 @@ Session.DRIFT = Session(6)
 Session.DRAG = Session(7)
 
 
+# The shared memory counts sessions from -1 (unknown), Session counts them from 0.
+_SESSIONS = (Session.UNKNOWN, Session.PRACTICE, Session.QUALIFYING, Session.RACE,
+             Session.HOTLAP, Session.TIME_ATTACK, Session.DRIFT, Session.DRAG)
+
+
 def current_session() -> Session:
     """
     Get the type of the current session.
     """
-    return Session(info.static.session)
+    index = info.graphics.session + 1
+    if not 0 <= index < len(_SESSIONS):
+        return Session.UNKNOWN
+    return _SESSIONS[index]
 
 
 class Flag:
@@ -79,11 +87,44 @@ Flag.CHECKERED_FLAG = Flag(5)
 Flag.PENALTY_FLAG = Flag(6)
 
 
+_FLAGS = (Flag.NO_FLAG, Flag.BLUE_FLAG, Flag.YELLOW_FLAG, Flag.BLACK_FLAG,
+          Flag.WHITE_FLAG, Flag.CHECKERED_FLAG, Flag.PENALTY_FLAG)
+
+
+def _flag(index: int) -> Flag:
+    if not 0 <= index < len(_FLAGS):
+        return None
+    return _FLAGS[index]
+
+
 def current_flag() -> Flag:
     """
     Get the type of the flag that is curently being shown on the track.
     """
-    try:
-        return Flag(info.physics.flag)
-    except ValueError:
-        return None
\ No newline at end of file
+    return _flag(info.graphics.flag)
+
+
+# The registered wrappers by callback, so remove_flag_change() can find them.
+_flag_callbacks = {}
+
+
+def on_flag_change(callback) -> None:
+    """
+    Call a function with the new Flag whenever the flag changes.
+    The change is detected by info.check_changes(), which should be called once per frame.
+    Registering the same function again replaces the earlier registration.
+    """
+    def on_change(name, value):
+        callback(_flag(value))
+    remove_flag_change(callback)
+    _flag_callbacks[callback] = on_change
+    info.on_change("graphics", "flag", on_change)
+
+
+def remove_flag_change(callback) -> None:
+    """
+    Stop calling a function that was registered with on_flag_change().
+    """
+    on_change = _flag_callbacks.pop(callback, None)
+    if on_change is not None:
+        info.remove_on_change(on_change)
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Consistency checks between the two sources of the player car channels that PlayerCar
+can read from the shared memory (see do_shared_memory()): the ac functions and the pages.
+Record both sources in the game with SourceRecorder, then compare the recording offline.
+"""
+import json
+
+from .channels import CAR_CHANNELS, TYRE_CHANNELS
+from .sim_info import info, SimInfo, SimFrame
+
+WHEELS = ("fl", "fr", "rl", "rr")
+
+
+def shared_channels() -> 'list[tuple]':
+    """
+    The channels that are in the shared memory, as (name, channel, wheel) tuples.
+    Tyre channels are listed once per wheel, named e.g. "fl.load".
+    """
+    channels = [(channel.name, channel, None) for channel in CAR_CHANNELS if channel.shared is not None]
+    for wheel, prefix in enumerate(WHEELS):
+        channels.extend(
+            ("{}.{}".format(prefix, channel.name), channel, wheel)
+            for channel in TYRE_CHANNELS if channel.shared is not None
+        )
+    return channels
+
+
+def _plain(value):
+    if isinstance(value, (bool, int, float)):
+        return value
+    return [value[0], value[1], value[2]]
+
+
+def read_sources(frame = None) -> dict:
+    """
+    Read every shared channel of the player car from both sources.
+
+    :param frame: The pages to read, a new snapshot of the global info if None.
+    :return: The values by channel name, as (ac value, shared memory value).
+        Vectors are lists of x, y and z.
+    """
+    if frame is None:
+        frame = info.snapshot()
+    values = {}
+    for name, channel, wheel in shared_channels():
+        function, args, index, transform = channel.reader(0, wheel)
+        value = function(*args)
+        if index is not None:
+            value = value[index]
+        if transform is not None and not channel.is_vector:
+            value = transform(value)
+        values[name] = (_plain(value), _plain(channel.shared.read(frame, wheel)))
+    return values
+
+
+class SourceRecorder:
+    """
+    Records both sources of the shared channels every time the physics packetId advances,
+    one JSON line per frame.
+    """
+
+    def __init__(self, path: str, sim_info: SimInfo = None):
+        """
+        :param path: The path of the file to record to.
+        :param sim_info: The shared memory to read, the global info if None.
+        """
+        self.info = info if sim_info is None else sim_info
+        self._file = open(path, "w")
+        self._frame = SimFrame()
+        self._last_packet = None
+        self.recorded = 0
+
+    def sample(self) -> bool:
+        """
+        Record the current frame if the physics packetId advanced since the last sample.
+
+        :return: True if a new frame was recorded.
+        """
+        frame = self.info.snapshot(frame=self._frame)
+        packet_id = frame.physics.packetId
+        if packet_id == self._last_packet:
+            return False
+        self._last_packet = packet_id
+        line = json.dumps({"packet": packet_id, "values": read_sources(frame)})
+        self._file.write(line + "\n")
+        self.recorded += 1
+        return True
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'SourceRecorder':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _difference(first, second) -> float:
+    if isinstance(first, list):
+        return max(abs(a - b) for a, b in zip(first, second))
+    return abs(first - second)
+
+
+def compare(path: str, tolerance: float = 1e-3) -> dict:
+    """
+    Compare the sources of a recording of SourceRecorder.
+    The ac functions and the pages may be updated at slightly different times, so a few
+    mismatches around fast changes are expected, a mismatch in every frame is not.
+
+    :param path: The path of the recording.
+    :param tolerance: The largest absolute difference that counts as equal.
+    :return: For every channel a dict with the number of frames, the number of mismatches
+        and the largest difference.
+    """
+    results = {}
+    with open(path) as file:
+        for line in file:
+            values = json.loads(line)["values"]
+            for name, (ac_value, shared_value) in values.items():
+                result = results.get(name)
+                if result is None:
+                    result = results[name] = {"frames": 0, "mismatches": 0, "max_difference": 0.0}
+                difference = _difference(ac_value, shared_value)
+                result["frames"] += 1
+                if difference > tolerance:
+                    result["mismatches"] += 1
+                if difference > result["max_difference"]:
+                    result["max_difference"] = difference
+    return results
+
+
+def report(path: str, tolerance: float = 1e-3) -> str:
+    """
+    A table of the comparison of a recording, see compare().
+    """
+    lines = ["{:<32} {:>8} {:>10} {:>14}".format("channel", "frames", "mismatches", "max difference")]
+    for name, result in compare(path, tolerance).items():
+        lines.append("{:<32} {:>8} {:>10} {:>14.6g}".format(
+            name, result["frames"], result["mismatches"], result["max_difference"]))
+    return "\n".join(lines)
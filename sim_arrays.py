@@ -0,0 +1,134 @@
+"""
+NumPy structured dtypes that match the shared memory structures byte for byte,
+so the pages can be viewed as arrays without copying them.
+NumPy is optional, it is only needed when these views are used.
+"""
+import ctypes
+from ctypes import c_int32, c_float
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .sim_info import WCHAR, SPageFilePhysics, SPageFileGraphic, SPageFileStatic
+
+
+_SCALAR_FORMATS = {
+    c_int32: "=i4",
+    c_float: "=f4",
+}
+
+
+def _field_format(ctype):
+    """
+    The NumPy format of a ctypes field type. Nested arrays such as c_float * 4 * 3
+    become subarrays with the same shape, (3, 4) in that case.
+    """
+    if issubclass(ctype, ctypes.Array):
+        if ctype._type_ is WCHAR:
+            # NumPy has no UTF-16 strings, so the raw code units are exposed instead.
+            return ("=u2", (ctype._length_,))
+        element = _field_format(ctype._type_)
+        if isinstance(element, tuple):
+            return (element[0], (ctype._length_,) + element[1])
+        return (element, (ctype._length_,))
+    if ctype not in _SCALAR_FORMATS:
+        raise TypeError("Unsupported field type: {}".format(ctype.__name__))
+    return _SCALAR_FORMATS[ctype]
+
+
+def structure_dtype(structure) -> 'np.dtype':
+    """
+    Build a structured dtype with the same field offsets and size as a ctypes structure.
+
+    :param structure: A ctypes.Structure subclass, e.g. SPageFilePhysics.
+    :raises ValueError: If the resulting layout does not match the structure.
+    """
+    if np is None:
+        raise ImportError("NumPy is required for the array views of the shared memory.")
+    names = [name for name, _ in structure._fields_]
+    dtype = np.dtype({
+        "names": names,
+        "formats": [_field_format(ctype) for _, ctype in structure._fields_],
+        "offsets": [getattr(structure, name).offset for name in names],
+        "itemsize": ctypes.sizeof(structure),
+    })
+    check_layout(structure, dtype)
+    return dtype
+
+
+def check_layout(structure, dtype: 'np.dtype') -> None:
+    """
+    Check that the dtype reads the same values as the ctypes structure. A distinct value
+    is written through ctypes into every element of every field, then each field is read
+    back both through ctypes and through the dtype, and the two reads are compared.
+
+    :raises ValueError: If the size or any field differs.
+    """
+    if dtype.itemsize != ctypes.sizeof(structure):
+        raise ValueError("{} is {} bytes, but its dtype is {} bytes.".format(
+            structure.__name__, ctypes.sizeof(structure), dtype.itemsize))
+    page = structure()
+    counter = iter(range(1, ctypes.sizeof(structure)))
+    for name, ctype in structure._fields_:
+        setattr(page, name, _test_value(ctype, counter))
+    view = np.frombuffer(bytearray(page), dtype=dtype, count=1).reshape(())
+    for name, ctype in structure._fields_:
+        expected = _plain_value(ctype, getattr(page, name))
+        actual = view[name].tolist()
+        if actual != expected:
+            raise ValueError("{}.{} reads {!r} through ctypes, but {!r} through its dtype.".format(
+                structure.__name__, name, expected, actual))
+
+
+def _test_value(ctype, counter):
+    """
+    A value for a field of the given type where every element is different.
+    """
+    if issubclass(ctype, ctypes.Array):
+        return ctype(*(_test_value(ctype._type_, counter) for _ in range(ctype._length_)))
+    value = next(counter)
+    # Halves are exact in float32, so a float field reads back the value that was written.
+    return value + 0.5 if ctype is c_float else value
+
+
+def _plain_value(ctype, value):
+    """
+    A ctypes field value in the form NumPy's tolist() returns for the matching dtype field.
+    """
+    if issubclass(ctype, ctypes.Array):
+        return [_plain_value(ctype._type_, element) for element in value]
+    return value
+
+
+_dtypes = {}
+
+def page_dtype(structure) -> 'np.dtype':
+    """
+    The cached structured dtype of a shared memory structure.
+    """
+    dtype = _dtypes.get(structure)
+    if dtype is None:
+        dtype = _dtypes[structure] = structure_dtype(structure)
+    return dtype
+
+
+def page_view(buffer, structure) -> 'np.ndarray':
+    """
+    A read-only, zero-dimensional array view over a page, e.g. page_view(mmap, SPageFilePhysics).
+    Indexing a field returns a view too, so view["tyreWear"] is a float32 array of 4 elements
+    that follows the shared memory without any copying.
+    """
+    view = np.frombuffer(buffer, dtype=page_dtype(structure), count=1).reshape(())
+    view.flags.writeable = False
+    return view
+
+
+def do_test():
+    """
+    Check the layout of all the pages.
+    """
+    for structure in SPageFilePhysics, SPageFileGraphic, SPageFileStatic:
+        dtype = structure_dtype(structure)
+        print("{}: {} bytes, {} fields OK".format(structure.__name__, dtype.itemsize, len(dtype.names)))
@@ -1,9 +1,21 @@
 #updated to AC 1.14.3
 
+import os
+import gc
+import sys
 import mmap
+import time
+import struct
+import tempfile
+import operator
 import functools
 import ctypes
-from ctypes import c_int32, c_float, c_wchar
+from ctypes import c_int32, c_float, c_uint16
+
+# The element of the wide string fields. The game is built for Windows, where a wchar_t is
+# a 2-byte UTF-16 code unit, while c_wchar is 4 bytes on Linux. Declaring the strings as
+# code units gives the pages the layout of the game on every platform, see decode_string().
+WCHAR = c_uint16
 
 AC_STATUS = c_int32
 AC_OFF = 0
@@ -99,10 +111,10 @@ class SPageFileGraphic(ctypes.Structure):
         ('packetId', c_int32),
         ('status', AC_STATUS),
         ('session', AC_SESSION_TYPE),
-        ('currentTime', c_wchar * 15),
-        ('lastTime', c_wchar * 15),
-        ('bestTime', c_wchar * 15),
-        ('split', c_wchar * 15),
+        ('currentTime', WCHAR * 15),
+        ('lastTime', WCHAR * 15),
+        ('bestTime', WCHAR * 15),
+        ('split', WCHAR * 15),
         ('completedLaps', c_int32),
         ('position', c_int32),
         ('iCurrentTime', c_int32),
@@ -114,7 +126,7 @@ class SPageFileGraphic(ctypes.Structure):
         ('currentSectorIndex', c_int32),
         ('lastSectorTime', c_int32),
         ('numberOfLaps', c_int32),
-        ('tyreCompound', c_wchar * 33),
+        ('tyreCompound', WCHAR * 33),
         ('replayTimeMultiplier', c_float),
         ('normalizedCarPosition', c_float),
         ('carCoordinates', c_float * 3),
@@ -131,15 +143,15 @@ class SPageFileGraphic(ctypes.Structure):
 class SPageFileStatic(ctypes.Structure):
     _pack_ = 4
     _fields_ = [
-        ('_smVersion', c_wchar * 15),
-        ('_acVersion', c_wchar * 15),
+        ('_smVersion', WCHAR * 15),
+        ('_acVersion', WCHAR * 15),
         ('numberOfSessions', c_int32),
         ('numCars', c_int32),
-        ('carModel', c_wchar * 33),
-        ('track', c_wchar * 33),
-        ('playerName', c_wchar * 33),
-        ('playerSurname', c_wchar * 33),
-        ('playerNick', c_wchar * 33),
+        ('carModel', WCHAR * 33),
+        ('track', WCHAR * 33),
+        ('playerName', WCHAR * 33),
+        ('playerSurname', WCHAR * 33),
+        ('playerNick', WCHAR * 33),
         ('sectorCount', c_int32),
         ('maxTorque', c_float),
         ('maxPower', c_float),
@@ -165,50 +177,752 @@ class SPageFileStatic(ctypes.Structure):
         ('engineBrakeSettingsCount', c_int32),
         ('ersPowerControllerCount', c_int32),
         ('trackSPlineLength', c_float),
-        ('trackConfiguration', c_wchar * 33),
+        ('trackConfiguration', WCHAR * 33),
         ('ersMaxJ', c_float),
         ('isTimedRace', c_int32),
         ('hasExtraLap', c_int32),
-        ('carSkin', c_wchar * 33),
+        ('carSkin', WCHAR * 33),
         ('reversedGridPositions', c_int32),
         ('pitWindowStart', c_int32),
         ('pitWindowEnd', c_int32)
         ]
 
+class TornReadError(Exception):
+    """Exception raised when a page keeps changing while it is being copied."""
+
+
+class SimFrame:
+    """
+    A consistent copy of the shared memory pages, as returned by SimInfo.snapshot().
+    Every page is a private copy, so all fields of a page belong to the same packet.
+    The pages of a frame can't be replaced, but they are ordinary ctypes structures:
+    writing to a field only changes the copy, not the game. A frame is never handed to
+    two owners, SimInfo.frames() gives every consumer its own.
+    """
+    __slots__ = ("physics", "graphics", "static")
+
+    def __init__(self,
+        physics: SPageFilePhysics = None,
+        graphics: SPageFileGraphic = None,
+        static: SPageFileStatic = None
+    ):
+        """
+        :param physics: The physics page, a new zeroed page if None. The same for the other pages.
+        """
+        physics = SPageFilePhysics() if physics is None else physics
+        graphics = SPageFileGraphic() if graphics is None else graphics
+        static = SPageFileStatic() if static is None else static
+        object.__setattr__(self, "physics", physics)
+        object.__setattr__(self, "graphics", graphics)
+        object.__setattr__(self, "static", static)
+
+    def copy(self) -> 'SimFrame':
+        """
+        A frame with copies of the pages of this one.
+        """
+        return SimFrame(
+            SPageFilePhysics.from_buffer_copy(self.physics),
+            SPageFileGraphic.from_buffer_copy(self.graphics),
+            SPageFileStatic.from_buffer_copy(self.static),
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SimFrame is read-only.")
+
+    def __delattr__(self, name):
+        raise AttributeError("SimFrame is read-only.")
+
+
+def _copy_page(destination, source, retries: int) -> None:
+    """
+    Copy a page with a single memmove, retrying while the packetId changes during the copy.
+    """
+    size = ctypes.sizeof(source)
+    for _ in range(retries):
+        packet_id = source.packetId
+        ctypes.memmove(ctypes.addressof(destination), ctypes.addressof(source), size)
+        if destination.packetId == packet_id == source.packetId:
+            return
+    raise TornReadError("{} changed during {} copy attempts.".format(type(source).__name__, retries))
+
+
+# The static fields that identify a session, the static page is assumed unchanged while they are.
+SESSION_FIELDS = ("_acVersion", "numberOfSessions", "carModel", "track")
+
+
+def decode_string(units) -> str:
+    """
+    Decode a wide string field, an array of WCHAR code units, up to the first null character.
+    """
+    text = bytes(units).decode("utf-16-le", "replace")
+    end = text.find("\0")
+    return text if end < 0 else text[:end]
+
+
+def field_value(value):
+    """
+    A field as a plain value: wide strings are decoded and other arrays become tuples.
+    """
+    if isinstance(value, ctypes.Array):
+        if value._type_ is WCHAR:
+            return decode_string(value)
+        return tuple(value)
+    return value
+
+
+def field_span(structure, names) -> 'tuple[int, int]':
+    """
+    The smallest byte range (start, end) of a structure that covers all the given fields.
+    """
+    fields = [getattr(structure, name) for name in names]
+    return min(field.offset for field in fields), max(field.offset + field.size for field in fields)
+
+
+def string_fields(structure) -> 'tuple[str]':
+    """
+    The names of the wide string fields of a structure.
+    """
+    return tuple(
+        name for name, ctype in structure._fields_
+        if issubclass(ctype, ctypes.Array) and ctype._type_ is WCHAR
+    )
+
+
+class PageRecord:
+    """
+    A read-only copy of fields of a page, with strings decoded and other arrays converted to tuples.
+    Subclasses list the fields in __slots__.
+    """
+    __slots__ = ()
+
+    def __init__(self, page):
+        for name in self.__slots__:
+            object.__setattr__(self, name, field_value(getattr(page, name)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is read-only.".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("{} is read-only.".format(type(self).__name__))
+
+
+class GraphicStrings(PageRecord):
+    """
+    The decoded wide string fields of the graphics page.
+    """
+    __slots__ = string_fields(SPageFileGraphic)
+
+
+class StaticStrings(PageRecord):
+    """
+    The decoded wide string fields of the static page.
+    """
+    __slots__ = string_fields(SPageFileStatic)
+
+
+class StaticInfo(PageRecord):
+    """
+    All fields of the static page, copied once per session.
+    """
+    __slots__ = tuple(name for name, _ in SPageFileStatic._fields_)
+
+
+_STRUCT_CODES = {
+    c_int32: "i",
+    c_float: "f",
+}
+
+
+def _base_type(ctype):
+    while issubclass(ctype, ctypes.Array):
+        ctype = ctype._type_
+    return ctype
+
+
+class Projection:
+    """
+    Reads a fixed selection of fields of a page with a single struct.unpack_from, instead of
+    one ctypes lookup per field. The byte offsets and the struct format are computed once.
+    """
+
+    def __init__(self, buffer, structure, names: 'list[str]'):
+        """
+        :param buffer: The buffer that holds the page, e.g. the mmap of the page.
+        :param structure: The ctypes structure of the page.
+        :param names: The names of the fields to read.
+        """
+        if not names:
+            raise ValueError("A projection needs at least one field.")
+        self.names = tuple(names)
+        self._buffer = buffer
+        fields = sorted(set(self.names), key=lambda name: getattr(structure, name).offset)
+        format = "="
+        position = 0
+        index = 0
+        getters = {}
+        for name in fields:
+            field = getattr(structure, name)
+            ctype = dict(structure._fields_)[name]
+            base = _base_type(ctype)
+            if field.offset > position:
+                format += "{}x".format(field.offset - position)
+            if base is WCHAR:
+                format += "{}s".format(field.size)
+                getters[name] = (index, "text")
+                index += 1
+            elif issubclass(ctype, ctypes.Array):
+                count = field.size // ctypes.sizeof(base)
+                format += "{}{}".format(count, _STRUCT_CODES[base])
+                if issubclass(ctype._type_, ctypes.Array):
+                    # Nested arrays such as c_float * 4 * 3 are returned as a tuple of rows.
+                    width = ctype._type_._length_
+                    rows = tuple(slice(start, start + width) for start in range(index, index + count, width))
+                    getters[name] = (rows, "rows")
+                else:
+                    getters[name] = (slice(index, index + count), "array")
+                index += count
+            else:
+                format += _STRUCT_CODES[base]
+                getters[name] = (index, "scalar")
+                index += 1
+            position = field.offset + field.size
+        self._struct = struct.Struct(format)
+        self._getters = tuple(getters[name] for name in self.names)
+        if all(kind == "scalar" for _, kind in self._getters):
+            self._itemgetter = operator.itemgetter(*(key for key, _ in self._getters))
+            self._single = len(self._getters) == 1
+        else:
+            self._itemgetter = None
+
+    def read(self) -> tuple:
+        """
+        Read the fields, in the order they were requested.
+        Array fields are returned as tuples and string fields as str.
+        """
+        values = self._struct.unpack_from(self._buffer)
+        if self._itemgetter is not None:
+            result = self._itemgetter(values)
+            return (result,) if self._single else result
+        result = []
+        for key, kind in self._getters:
+            if kind == "text":
+                text = values[key].decode("utf-16-le", "replace")
+                end = text.find("\0")
+                result.append(text if end < 0 else text[:end])
+            elif kind == "rows":
+                result.append(tuple(values[row] for row in key))
+            else:
+                result.append(values[key])
+        return tuple(result)
+
+
+class ChangeWatcher:
+    """
+    Calls back when watched fields of a page change. Each check copies only the byte ranges
+    of the watched fields and compares them with the previous copy, and only the fields whose
+    bytes changed are decoded and reported.
+    """
+
+    def __init__(self, page):
+        """
+        :param page: The ctypes structure of the page.
+        """
+        self._page = page
+        self._structure = type(page)
+        self._watches = []
+        self._spans = ()
+        self._previous = {}
+
+    def add(self, names: 'list[str]', callback) -> None:
+        """
+        Watch fields of the page.
+
+        :param names: The names of the fields.
+        :param callback: A function that is called with the name and the new value of a changed field.
+        """
+        for name in names:
+            field = getattr(self._structure, name)
+            self._watches.append((name, field.offset, field.offset + field.size, callback))
+        self._update_spans()
+
+    def remove(self, callback) -> None:
+        """
+        Stop calling a callback.
+        """
+        self._watches = [watch for watch in self._watches if watch[3] is not callback]
+        self._update_spans()
+
+    def _update_spans(self) -> None:
+        # Merge the byte ranges of the watched fields, so adjacent fields are compared in one go.
+        spans = []
+        for _, start, end, _ in sorted(self._watches, key=lambda watch: watch[1]):
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], end)
+            else:
+                spans.append([start, end])
+        address = ctypes.addressof(self._page)
+        self._spans = tuple(
+            (start, end, tuple(watch for watch in self._watches if start <= watch[1] < end))
+            for start, end in spans
+        )
+        self._previous = {start: ctypes.string_at(address + start, end - start) for start, end, _ in self._spans}
+
+    def check(self) -> int:
+        """
+        Compare the watched fields with the last check and call back for the ones that changed.
+
+        :return: The number of callbacks that were called.
+        """
+        address = ctypes.addressof(self._page)
+        previous = self._previous
+        changed = None
+        for start, end, watches in self._spans:
+            data = ctypes.string_at(address + start, end - start)
+            old = previous[start]
+            if data == old:
+                continue
+            previous[start] = data
+            if changed is None:
+                changed = []
+                # The new values are decoded from the copies that were compared, not from the live page.
+                page = self._structure()
+            ctypes.memmove(ctypes.addressof(page) + start, data, len(data))
+            for watch in watches:
+                field_start, field_end = watch[1] - start, watch[2] - start
+                if data[field_start:field_end] != old[field_start:field_end]:
+                    changed.append(watch)
+        if changed is None:
+            return 0
+        for name, _, _, callback in changed:
+            callback(name, field_value(getattr(page, name)))
+        return len(changed)
+
+
+class SharedMemoryBackend:
+    """
+    A base class for the ways the acpmf_* pages can be mapped into memory.
+    """
+    def open(self, name: str, size: int) -> mmap.mmap:
+        """
+        Map a page.
+
+        :param name: The name of the page, e.g. "acpmf_physics".
+        :param size: The size of the page in bytes.
+        """
+        raise NotImplementedError("Subclasses must implement the open method.")
+
+
+class NamedMappingBackend(SharedMemoryBackend):
+    """
+    The named file mappings that Assetto Corsa creates on Windows.
+    """
+    def open(self, name: str, size: int) -> mmap.mmap:
+        return mmap.mmap(0, size, name)
+
+
+class FileBackend(SharedMemoryBackend):
+    """
+    One file per page in a directory, so the pages can be written by another
+    process (a replay or a load test) on any platform. Missing or short page
+    files are created and padded with zeros to the size of the page.
+    """
+    def __init__(self, directory: str):
+        """
+        :param directory: The directory that contains the page files.
+        """
+        self.directory = directory
+
+    def path(self, name: str) -> str:
+        """
+        The path of the file for a page.
+        """
+        return os.path.join(self.directory, name)
+
+    def open(self, name: str, size: int) -> mmap.mmap:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(name)
+        with open(path, "ab"):
+            pass
+        with open(path, "r+b") as file:
+            if os.fstat(file.fileno()).st_size < size:
+                file.truncate(size)
+            return mmap.mmap(file.fileno(), size)
+
+
+def default_backend() -> SharedMemoryBackend:
+    """
+    The named mappings of the game on Windows. On other platforms, the page files in the
+    directory given by the BETTER_AC_SHM_DIR environment variable, or a temporary directory.
+    """
+    if sys.platform == "win32":
+        return NamedMappingBackend()
+    directory = os.environ.get("BETTER_AC_SHM_DIR", os.path.join(tempfile.gettempdir(), "better_ac"))
+    return FileBackend(directory)
+
+
 class SimInfo:
-    def __init__(self):
-        self._acpmf_physics = mmap.mmap(0, ctypes.sizeof(SPageFilePhysics), "acpmf_physics")
-        self._acpmf_graphics = mmap.mmap(0, ctypes.sizeof(SPageFileGraphic), "acpmf_graphics")
-        self._acpmf_static = mmap.mmap(0, ctypes.sizeof(SPageFileStatic), "acpmf_static")
+    def __init__(self, backend: SharedMemoryBackend = None):
+        """
+        Map the shared memory pages.
+
+        :param backend: How the pages are mapped, the default_backend() if None.
+        """
+        self.backend = default_backend() if backend is None else backend
+        self._acpmf_physics = self.backend.open("acpmf_physics", ctypes.sizeof(SPageFilePhysics))
+        self._acpmf_graphics = self.backend.open("acpmf_graphics", ctypes.sizeof(SPageFileGraphic))
+        self._acpmf_static = self.backend.open("acpmf_static", ctypes.sizeof(SPageFileStatic))
         self.physics = SPageFilePhysics.from_buffer(self._acpmf_physics)
         self.graphics = SPageFileGraphic.from_buffer(self._acpmf_graphics)
         self.static = SPageFileStatic.from_buffer(self._acpmf_static)
+        self._arrays = {}
+        self._session_span = field_span(SPageFileStatic, SESSION_FIELDS)
+        self._session = None
+        self._session_packet = None
+        self._graphics_strings = None
+        self._graphics_strings_packet = None
+        self._static_strings = None
+        self._static_info = None
+        self._streams = {}
+        self._watchers = {}
+        self._closed = False
+
+    def session_key(self) -> bytes:
+        """
+        The raw bytes of the static fields that identify the session (see SESSION_FIELDS).
+        """
+        start, end = self._session_span
+        return ctypes.string_at(ctypes.addressof(self.static) + start, end - start)
+
+    @property
+    def graphics_strings(self) -> GraphicStrings:
+        """
+        The decoded string fields of the graphics page, e.g. info.graphics_strings.currentTime.
+        They are decoded once per packet, keep the record to read several of them.
+        """
+        packet_id = self.graphics.packetId
+        if packet_id != self._graphics_strings_packet or self._graphics_strings is None:
+            self._graphics_strings = GraphicStrings(self.graphics)
+            self._graphics_strings_packet = packet_id
+        return self._graphics_strings
+
+    @property
+    def static_strings(self) -> StaticStrings:
+        """
+        The decoded string fields of the static page, e.g. info.static_strings.track.
+        They are decoded once per session.
+        """
+        self.check_session()
+        return self._static_strings
+
+    @property
+    def static_info(self) -> StaticInfo:
+        """
+        A read-only copy of the static page that is only rebuilt when a new session is loaded,
+        i.e. when one of the SESSION_FIELDS changes. Code that reads it in a hot loop can keep
+        the record and call check_session() once per frame, as PlayerCar does.
+        """
+        self.check_session()
+        return self._static_info
+
+    def check_session(self) -> bool:
+        """
+        Check whether a new session was loaded, and if so rebuild static_info and static_strings.
+        The session fields are only compared when the graphics packetId has changed, since the
+        game does not write any page between packets.
+
+        :return: True if the session changed since the last check.
+        """
+        packet_id = self.graphics.packetId
+        if packet_id == self._session_packet and self._session is not None:
+            return False
+        self._session_packet = packet_id
+        key = self.session_key()
+        if key == self._session:
+            return False
+        self._session = key
+        self._static_strings = StaticStrings(self.static)
+        self._static_info = StaticInfo(self.static)
+        return True
+
+    def physics_projection(self, names: 'list[str]') -> Projection:
+        """
+        A projection of fields of the physics page,
+        e.g. info.physics_projection(["gas", "brake", "speedKmh", "wheelSlip"]).read().
+        """
+        return Projection(self._acpmf_physics, SPageFilePhysics, names)
+
+    def graphics_projection(self, names: 'list[str]') -> Projection:
+        """
+        A projection of fields of the graphics page.
+        """
+        return Projection(self._acpmf_graphics, SPageFileGraphic, names)
+
+    def static_projection(self, names: 'list[str]') -> Projection:
+        """
+        A projection of fields of the static page.
+        """
+        return Projection(self._acpmf_static, SPageFileStatic, names)
+
+    def _array(self, name: str, buffer, structure):
+        view = self._arrays.get(name)
+        if view is None:
+            from .sim_arrays import page_view
+            view = self._arrays[name] = page_view(buffer, structure)
+        return view
+
+    @property
+    def physics_array(self):
+        """
+        A zero-copy, read-only NumPy view over the physics page. Requires NumPy.
+        """
+        return self._array("physics", self._acpmf_physics, SPageFilePhysics)
+
+    @property
+    def graphics_array(self):
+        """
+        A zero-copy, read-only NumPy view over the graphics page. Requires NumPy.
+        """
+        return self._array("graphics", self._acpmf_graphics, SPageFileGraphic)
+
+    @property
+    def static_array(self):
+        """
+        A zero-copy, read-only NumPy view over the static page. Requires NumPy.
+        """
+        return self._array("static", self._acpmf_static, SPageFileStatic)
+
+    def snapshot(self, retries: int = 8, frame: SimFrame = None) -> SimFrame:
+        """
+        Copy all pages into a frame and return it as a consistent frame.
+        The physics and graphics pages are copied again if their packetId changed
+        while they were being copied.
+
+        Without a frame, new buffers are allocated (about 2 KB), so the frame can be kept.
+        Pass a frame, e.g. SimFrame() created once, to refill it in place with one copy
+        per page and no allocation; the previous contents are then overwritten.
+
+        :param retries: The number of copy attempts per page before giving up.
+        :param frame: The frame to copy into, a new frame if None.
+        :raises TornReadError: If a page kept changing for all attempts.
+        """
+        if frame is None:
+            frame = SimFrame()
+        _copy_page(frame.physics, self.physics, retries)
+        _copy_page(frame.graphics, self.graphics, retries)
+        static = frame.static
+        ctypes.memmove(ctypes.addressof(static), ctypes.addressof(self.static), ctypes.sizeof(static))
+        return frame
+
+    def on_change(self, page: str, names, callback) -> None:
+        """
+        Call back when fields of a page change, e.g. info.on_change("graphics", "flag", callback)
+        or info.on_change("physics", ["pitLimiterOn", "gear"], callback). The changes are detected
+        by check_changes(), which should be called once per frame.
+
+        :param page: The page of the fields, "physics", "graphics" or "static".
+        :param names: The name of a field, or a list of names.
+        :param callback: A function that is called with the name and the new value of a changed field.
+        """
+        if page not in ("physics", "graphics", "static"):
+            raise ValueError("Page must be 'physics', 'graphics' or 'static'.")
+        if isinstance(names, str):
+            names = [names]
+        watcher = self._watchers.get(page)
+        if watcher is None:
+            watcher = self._watchers[page] = ChangeWatcher(getattr(self, page))
+        watcher.add(names, callback)
+
+    def remove_on_change(self, callback) -> None:
+        """
+        Stop calling a callback that was registered with on_change().
+        """
+        for watcher in self._watchers.values():
+            watcher.remove(callback)
+
+    def check_changes(self) -> int:
+        """
+        Call back for every watched field that changed since the last check.
+
+        :return: The number of callbacks that were called.
+        """
+        called = 0
+        for watcher in self._watchers.values():
+            called += watcher.check()
+        return called
+
+    def frames(self, page: str = "physics", min_interval: float = 0.0):
+        """
+        An async generator of consistent snapshots, one each time the packetId of a page advances:
+        async for frame in info.frames("physics", min_interval=0.01): ...
+        Any number of consumers can iterate at once, a slow one skips to the latest frame.
+        Every consumer gets frames of its own, which it may keep or change.
+
+        :param page: The page whose packetId drives the stream, "physics" or "graphics".
+        :param min_interval: The minimum time between two frames for this consumer, in seconds.
+        """
+        from .streams import frames
+        return frames(self, page, min_interval)
 
     def close(self):
-        self._acpmf_physics.close()
-        self._acpmf_graphics.close()
-        self._acpmf_static.close()
+        """
+        Unmap the pages. The pages, array views, watchers and streams of this SimInfo can't
+        be used afterwards, snapshots taken before stay valid. Closing again does nothing.
+        """
+        if getattr(self, "_closed", True):
+            return
+        for stream in list(self._streams.values()):
+            stream.close()
+        self._streams.clear()
+        self._watchers.clear()
+        self._arrays.clear()
+        # The structures export the buffers, so they must go before the buffers can be closed.
+        for page in "physics", "graphics", "static":
+            self.__dict__.pop(page, None)
+        buffers = self._acpmf_physics, self._acpmf_graphics, self._acpmf_static
+        try:
+            for buffer in buffers:
+                buffer.close()
+        except BufferError:
+            # Finished tasks and generators often keep views alive in reference cycles.
+            gc.collect()
+            for buffer in buffers:
+                buffer.close()
+        self._closed = True
 
     def __del__(self):
         self.close()
 
+class PacketPoller:
+    """
+    Waits for the packetId of a page to advance, for consumers that run outside the render callback.
+    It sleeps until the next packet is expected, based on the observed packet rate, and backs off
+    while no packets arrive (e.g. while the game is paused), so it neither spins a core nor lags behind.
+    """
+
+    def __init__(self, sim_info: SimInfo = None, page: str = "physics",
+        min_sleep: float = 0.0005,
+        max_sleep: float = 0.05
+    ):
+        """
+        :param sim_info: The shared memory to poll, the global info if None.
+        :param page: The page whose packetId is polled, "physics" or "graphics".
+        :param min_sleep: The shortest sleep in seconds, used while a packet is due.
+        :param max_sleep: The longest sleep in seconds, used while no packets arrive.
+        """
+        if page not in ("physics", "graphics"):
+            raise ValueError("Page must be 'physics' or 'graphics'.")
+        self._page = getattr(info if sim_info is None else sim_info, page)
+        self.min_sleep = min_sleep
+        self.max_sleep = max_sleep
+        self._last_packet = self._page.packetId
+        self._last_time = time.perf_counter()
+        self._interval = None
+        self._jitter = 0.0
+        self._backoff = min_sleep
+        self.packets = 0
+        self.missed = 0
+
+    @property
+    def hz(self) -> float:
+        """
+        The observed packet rate, 0.0 until two packets have been seen.
+        """
+        return 1.0 / self._interval if self._interval else 0.0
+
+    @property
+    def jitter(self) -> float:
+        """
+        The average deviation of the packet intervals from the mean interval, in seconds.
+        """
+        return self._jitter
+
+    def _observe(self, packet_id: int, now: float) -> None:
+        advanced = packet_id - self._last_packet
+        if advanced > 1:
+            self.missed += advanced - 1
+        if self.packets > 0 and advanced > 0:
+            interval = (now - self._last_time) / advanced
+            if self._interval is None:
+                self._interval = interval
+            else:
+                self._jitter += (abs(interval - self._interval) - self._jitter) * 0.1
+                self._interval += (interval - self._interval) * 0.1
+        self.packets += 1
+        self._last_packet = packet_id
+        self._last_time = now
+
+    def poll(self) -> int:
+        """
+        Check the packetId once, without waiting.
+
+        :return: The new packetId, or None if it has not changed.
+        """
+        packet_id = self._page.packetId
+        if packet_id == self._last_packet:
+            return None
+        self._observe(packet_id, time.perf_counter())
+        self._backoff = self.min_sleep
+        return packet_id
+
+    def delay(self) -> float:
+        """
+        How long to sleep before the next poll() after one that returned None.
+        """
+        now = time.perf_counter()
+        interval = self._interval
+        if interval is not None and now < self._last_time + interval * 0.8:
+            # Wake up a little before the packet is due, then poll.
+            return max(self._last_time + interval * 0.8 - now, self.min_sleep)
+        if interval is not None and now < self._last_time + interval * 2:
+            return self.min_sleep
+        delay = self._backoff
+        self._backoff = min(self._backoff * 2, self.max_sleep)
+        return delay
+
+    def wait(self, timeout: float = None) -> int:
+        """
+        Wait until the packetId changes.
+
+        :param timeout: The maximum time to wait in seconds, forever if None.
+        :return: The new packetId, or None if the timeout expired.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            packet_id = self.poll()
+            if packet_id is not None:
+                return packet_id
+            delay = self.delay()
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return None
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    def __iter__(self):
+        """
+        Iterate over the packetIds as they arrive.
+        """
+        while True:
+            yield self.wait()
+
+
 info = SimInfo()
 
 def demo():
-    import time
-
+    poller = PacketPoller(info, "graphics")
     for _ in range(400):
-        print(info.static.track, info.graphics.tyreCompound, info.graphics.currentTime,
-              info.physics.rpms, info.graphics.currentTime, info.static.maxRpm, list(info.physics.tyreWear))
-        time.sleep(0.1)
+        poller.wait()
+        strings = info.graphics_strings
+        print(info.static_strings.track, strings.tyreCompound, strings.currentTime,
+              info.physics.rpms, strings.currentTime, info.static.maxRpm, list(info.physics.tyreWear))
+    print("{:.1f} Hz, {:.2f} ms jitter, {} missed".format(poller.hz, poller.jitter * 1000, poller.missed))
 
 def do_test():
     for struct in info.static, info.graphics, info.physics:
         print(struct.__class__.__name__)
         for field, type_spec in struct._fields_:
-            value = getattr(struct, field)
-            if not isinstance(value, (str, float, int)):
-                value = list(value)
+            value = field_value(getattr(struct, field))
             print(" {} -> {} {}".format(field, type(value), value))
 
 if __name__ == '__main__':
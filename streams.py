@@ -0,0 +1,160 @@
+"""
+An asyncio stream of consistent SimInfo frames, see SimInfo.frames().
+"""
+import asyncio
+
+from .sim_info import SimInfo, SimFrame, PacketPoller, TornReadError
+
+
+class _Subscriber:
+    """
+    The mailbox of one consumer. It only keeps the latest frame, so a slow
+    consumer skips to the newest frame instead of building up a backlog.
+    """
+    __slots__ = ("frame", "shared", "error", "event", "dropped")
+
+    def __init__(self):
+        self.frame = None
+        self.shared = False
+        self.error = None
+        self.event = asyncio.Event()
+        self.dropped = 0
+
+    def publish(self, frame: SimFrame, shared: bool) -> None:
+        """
+        :param shared: True if other subscribers got the same frame, so it is copied before
+            it is handed to the consumer.
+        """
+        if self.event.is_set():
+            self.dropped += 1
+        self.frame = frame
+        self.shared = shared
+        self.event.set()
+
+    def fail(self, error: BaseException) -> None:
+        self.error = error
+        self.event.set()
+
+
+class FrameStream:
+    """
+    Polls one page of a SimInfo and publishes a snapshot to every subscriber each time
+    its packetId advances. One stream serves all consumers of a page on an event loop,
+    and its polling task only runs while there are subscribers.
+
+    A packet whose pages kept changing while they were copied is skipped and counted in torn.
+    Any other error stops the stream and is raised by the frames() of every subscriber.
+    """
+
+    def __init__(self, sim_info: SimInfo, page: str, key):
+        self.info = sim_info
+        self.page = page
+        self._key = key
+        self._subscribers = set()
+        self._task = None
+        self._poller = None
+        self.torn = 0
+
+    def subscribe(self) -> _Subscriber:
+        subscriber = _Subscriber()
+        self._subscribers.add(subscriber)
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._produce())
+        return subscriber
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+        if not self._subscribers:
+            self._forget()
+
+    def _forget(self) -> None:
+        # A failed stream may already have been replaced by a new one for the same key.
+        if self.info._streams.get(self._key) is self:
+            del self.info._streams[self._key]
+
+    def close(self) -> None:
+        """
+        Stop polling, e.g. when the SimInfo is closed. Waiting consumers get a RuntimeError.
+        """
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._fail(RuntimeError("The SimInfo of the stream was closed."))
+
+    def _fail(self, error: BaseException) -> None:
+        """
+        Pass an error to every subscriber and drop the stream, so the next consumer
+        starts a new one.
+        """
+        self._task = None
+        # The poller holds the page, which keeps the mapping open until it is dropped.
+        self._poller = None
+        for subscriber in self._subscribers:
+            subscriber.fail(error)
+        self._subscribers.clear()
+        self._forget()
+
+    async def _produce(self) -> None:
+        try:
+            self._poller = PacketPoller(self.info, self.page)
+            while self._subscribers:
+                if self._poller.poll() is None:
+                    await asyncio.sleep(self._poller.delay())
+                    continue
+                try:
+                    frame = self.info.snapshot()
+                except TornReadError:
+                    # Skip this packet, the next one is usually only a few milliseconds away.
+                    self.torn += 1
+                    continue
+                shared = len(self._subscribers) > 1
+                for subscriber in self._subscribers:
+                    subscriber.publish(frame, shared)
+                # Let the consumers run before polling again.
+                await asyncio.sleep(0)
+        except Exception as error:
+            self._fail(error)
+
+
+def _stream(sim_info: SimInfo, page: str) -> FrameStream:
+    """
+    The stream of a page for the running event loop.
+    """
+    key = (page, asyncio.get_running_loop())
+    stream = sim_info._streams.get(key)
+    if stream is None:
+        stream = sim_info._streams[key] = FrameStream(sim_info, page, key)
+    return stream
+
+
+async def frames(sim_info: SimInfo, page: str = "physics", min_interval: float = 0.0):
+    """
+    Yield a consistent snapshot every time the packetId of a page advances.
+    A consumer that is slower than the packet rate gets the latest frame and skips the rest.
+
+    :param sim_info: The shared memory to read.
+    :param page: The page whose packetId drives the stream, "physics" or "graphics".
+    :param min_interval: The minimum time between two frames for this consumer, in seconds.
+    :raises Exception: The error that stopped the stream, e.g. when reading the pages failed.
+    """
+    if page not in ("physics", "graphics"):
+        raise ValueError("Page must be 'physics' or 'graphics'.")
+    loop = asyncio.get_running_loop()
+    stream = _stream(sim_info, page)
+    subscriber = stream.subscribe()
+    try:
+        next_time = None
+        while True:
+            if next_time is not None:
+                remaining = next_time - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+            await subscriber.event.wait()
+            subscriber.event.clear()
+            if subscriber.error is not None:
+                raise subscriber.error
+            if min_interval:
+                next_time = loop.time() + min_interval
+            # Every consumer gets a frame of its own, so writing to one can't change another's.
+            yield subscriber.frame.copy() if subscriber.shared else subscriber.frame
+    finally:
+        stream.unsubscribe(subscriber)
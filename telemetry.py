@@ -0,0 +1,505 @@
+"""
+Recording of the shared memory pages to disk.
+"""
+import json
+import mmap
+import time
+import ctypes
+import struct
+import threading
+from array import array
+from ctypes import c_int32, c_float
+from queue import Queue
+
+from .sim_info import info, SimInfo, WCHAR, SPageFilePhysics, SPageFileGraphic, SPageFileStatic, TornReadError, _copy_page
+
+PHYSICS_SIZE = ctypes.sizeof(SPageFilePhysics)
+GRAPHICS_SIZE = ctypes.sizeof(SPageFileGraphic)
+STATIC_SIZE = ctypes.sizeof(SPageFileStatic)
+
+# A frame is the capture time followed by the raw physics and graphics pages.
+FRAME_TIME = struct.Struct("=d")
+PHYSICS_OFFSET = FRAME_TIME.size
+GRAPHICS_OFFSET = PHYSICS_OFFSET + PHYSICS_SIZE
+FRAME_SIZE = GRAPHICS_OFFSET + GRAPHICS_SIZE
+
+
+class Column:
+    """
+    A recorded channel: one field of a page, or the capture time of the frames.
+    """
+    __slots__ = ("name", "offset", "size", "format", "shape", "text")
+
+    def __init__(self, name: str, offset: int, size: int, format: str, shape: 'tuple[int]' = (), text: bool = False):
+        """
+        :param name: The name of the column, e.g. "physics.gas".
+        :param offset: The offset of the field in a frame.
+        :param size: The size of the field in bytes.
+        :param format: The array typecode of an element, e.g. "f".
+        :param shape: The shape of array fields, () for scalars.
+        :param text: True for wide string fields, which are stored as code units.
+        """
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.format = format
+        self.shape = tuple(shape)
+        self.text = text
+
+    def to_json(self) -> dict:
+        return {"name": self.name, "offset": self.offset, "size": self.size,
+                "format": self.format, "shape": list(self.shape), "text": self.text}
+
+    @staticmethod
+    def from_json(data: dict) -> 'Column':
+        return Column(data["name"], data["offset"], data["size"], data["format"], data["shape"], data["text"])
+
+
+def _element(ctype) -> 'tuple[str, tuple[int], bool]':
+    """
+    The element typecode, shape and text flag of a ctypes field type.
+    """
+    if issubclass(ctype, ctypes.Array):
+        typecode, shape, text = _element(ctype._type_)
+        if text:
+            return typecode, shape, text
+        return typecode, (ctype._length_,) + shape, text
+    if ctype is WCHAR:
+        return "H", (), True
+    if ctype is c_int32:
+        return "i", (), False
+    if ctype is c_float:
+        return "f", (), False
+    raise TypeError("Unsupported field type: {}".format(ctype.__name__))
+
+
+def frame_columns() -> 'list[Column]':
+    """
+    The columns of a frame: the capture time, then every physics and graphics field.
+    """
+    columns = [Column("time", 0, FRAME_TIME.size, "d")]
+    for prefix, structure, base in ("physics", SPageFilePhysics, PHYSICS_OFFSET), ("graphics", SPageFileGraphic, GRAPHICS_OFFSET):
+        for name, ctype in structure._fields_:
+            field = getattr(structure, name)
+            typecode, shape, text = _element(ctype)
+            columns.append(Column(prefix + "." + name, base + field.offset, field.size, typecode, shape, text))
+    return columns
+
+
+def page_layout() -> dict:
+    """
+    The page sizes and the width of a wide character. They are stored with every recording,
+    so a file whose pages don't have the layout of the game, e.g. one recorded with c_wchar
+    strings on Linux (4 bytes per character), is recognized instead of being misread.
+    """
+    return {"physics_size": PHYSICS_SIZE, "graphics_size": GRAPHICS_SIZE,
+            "static_size": STATIC_SIZE, "wchar_size": ctypes.sizeof(WCHAR)}
+
+
+def _unit(*values) -> 'tuple[int, str]':
+    """
+    The largest word size (and its memoryview format) that divides all values.
+    """
+    for unit, code in (4, "I"), (2, "H"):
+        if all(value % unit == 0 for value in values):
+            return unit, code
+    return 1, "B"
+
+
+def _gather(rows: memoryview, count: int, offset: int, size: int) -> bytearray:
+    """
+    Copy one field out of count rows of FRAME_SIZE bytes into a contiguous column,
+    with one strided copy per word of the field.
+    """
+    unit, code = _unit(offset, size, FRAME_SIZE)
+    column = bytearray(count * size)
+    source = rows.cast(code)
+    target = memoryview(column).cast(code)
+    words = size // unit
+    stride = FRAME_SIZE // unit
+    start = offset // unit
+    for word in range(words):
+        target[word::words] = source[start + word:start + word + count * stride:stride]
+    return column
+
+
+def _scatter(column: memoryview, rows: memoryview, count: int, offset: int, size: int) -> None:
+    """
+    The inverse of _gather, copy a contiguous column back into count rows.
+    """
+    unit, code = _unit(offset, size, FRAME_SIZE)
+    source = column.cast(code)
+    target = rows.cast(code)
+    words = size // unit
+    stride = FRAME_SIZE // unit
+    start = offset // unit
+    for word in range(words):
+        target[start + word:start + word + count * stride:stride] = source[word::words]
+
+
+def _array(typecode: str, data) -> array:
+    """
+    An array of the given typecode with a copy of the raw bytes of data.
+    """
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+def _decode(units: array) -> str:
+    """
+    Decode the code units of a wide string field, up to the first null character.
+    """
+    text = units.tobytes().decode("utf-16-le" if units.itemsize == 2 else "utf-32-le", "replace")
+    end = text.find("\0")
+    return text if end < 0 else text[:end]
+
+
+# The fields whose value ranges are indexed per chunk, and the keys they are stored under.
+INDEXED_COLUMNS = (
+    ("graphics.completedLaps", "laps"),
+    ("graphics.iCurrentTime", "time"),
+    ("graphics.normalizedCarPosition", "position"),
+)
+
+
+class ColumnWriter:
+    """
+    Writes frames to a chunked columnar file. Each chunk stores every column contiguously,
+    so a reader only has to touch the bytes of the columns it needs. The file ends with a
+    JSON footer that describes the page layout and the columns, holds the static page and
+    indexes the chunks by their completedLaps, iCurrentTime and normalizedCarPosition ranges.
+
+    Layout: MAGIC, chunks, footer, then the footer size and MAGIC again.
+    """
+    MAGIC = b"BACCOLS1"
+    TRAILER = struct.Struct("=Q8s")
+    ALIGNMENT = 8
+
+    def __init__(self, path: str, static: bytes):
+        """
+        :param path: The path of the file to write.
+        :param static: The raw static page of the session.
+        """
+        self._file = open(path, "wb")
+        self._file.write(ColumnWriter.MAGIC)
+        self._position = len(ColumnWriter.MAGIC)
+        self._static = static
+        self._columns = frame_columns()
+        self._chunks = []
+
+    def _write(self, data) -> int:
+        padding = -self._position % ColumnWriter.ALIGNMENT
+        if padding:
+            self._file.write(bytes(padding))
+            self._position += padding
+        offset = self._position
+        self._file.write(data)
+        self._position += len(data)
+        return offset
+
+    def write_chunk(self, frames: memoryview, count: int) -> None:
+        """
+        Write a chunk of count frames, FRAME_SIZE bytes each, as columns.
+        """
+        frames = frames.cast("B")
+        offsets = []
+        ranges = {}
+        indexed = dict(INDEXED_COLUMNS)
+        for column in self._columns:
+            data = _gather(frames, count, column.offset, column.size)
+            offsets.append(self._write(data))
+            if column.name in indexed:
+                values = _array(column.format, data)
+                ranges[indexed[column.name]] = [min(values), max(values)]
+        self._chunks.append({"count": count, "offsets": offsets, "ranges": ranges})
+
+    def close(self) -> None:
+        footer = json.dumps({
+            "layout": page_layout(),
+            "columns": [column.to_json() for column in self._columns],
+            "static": self._static.hex(),
+            "chunks": self._chunks,
+        }).encode("utf-8")
+        self._write(footer)
+        self._file.write(ColumnWriter.TRAILER.pack(len(footer), ColumnWriter.MAGIC))
+        self._file.close()
+
+
+class TelemetryFile:
+    """
+    Reads a file written by ColumnWriter. The file is memory mapped, so only the chunks
+    and columns that are read are loaded from disk.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The path of the recorded file.
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        trailer = ColumnWriter.TRAILER
+        footer_size, magic = trailer.unpack_from(self._mmap, len(self._mmap) - trailer.size)
+        if magic != ColumnWriter.MAGIC or self._mmap[:len(magic)] != ColumnWriter.MAGIC:
+            raise ValueError("'{}' is not a columnar telemetry file.".format(path))
+        footer_start = len(self._mmap) - trailer.size - footer_size
+        footer = json.loads(self._mmap[footer_start:footer_start + footer_size].decode("utf-8"))
+        self.columns = [Column.from_json(column) for column in footer["columns"]]
+        self._column_indices = {column.name: index for index, column in enumerate(self.columns)}
+        self._static = bytes.fromhex(footer["static"])
+        self.chunks = footer["chunks"]
+        # Files written before the layout was stored have none, so they never match.
+        self.layout = footer.get("layout")
+
+    def check_layout(self) -> None:
+        """
+        Check that the file was recorded with the page layout of the game, which rows() and
+        static need to rebuild the raw pages. The layout is the same on every platform, only
+        files written before the strings were declared as WCHAR differ. read() decodes the
+        columns of any recording.
+
+        :raises ValueError: If the page sizes, the wide character width or the columns differ.
+        """
+        local = page_layout()
+        if self.layout != local:
+            raise ValueError("The file was recorded with the page layout {}, but the pages have {}.".format(
+                self.layout, local))
+        if [column.to_json() for column in self.columns] != [column.to_json() for column in frame_columns()]:
+            raise ValueError("The columns of the file don't match the fields of the pages.")
+
+    @property
+    def static(self) -> SPageFileStatic:
+        """
+        The static page of the recorded session.
+
+        :raises ValueError: If the file has a different page layout, see check_layout().
+        """
+        self.check_layout()
+        return SPageFileStatic.from_buffer_copy(self._static)
+
+    def __len__(self) -> int:
+        """
+        The number of recorded frames.
+        """
+        return sum(chunk["count"] for chunk in self.chunks)
+
+    def column(self, name: str) -> Column:
+        """
+        Look up a column by its full name, e.g. "physics.gas", or by its field name, e.g. "gas",
+        when only one page has a field with that name.
+        """
+        if name in self._column_indices:
+            return self.columns[self._column_indices[name]]
+        matches = [column for column in self.columns if column.name.split(".", 1)[-1] == name]
+        if len(matches) != 1:
+            raise KeyError("{} column '{}'.".format("Ambiguous" if matches else "Unknown", name))
+        return matches[0]
+
+    def chunks_for(self, laps: 'tuple[int, int]' = None, time: 'tuple[int, int]' = None,
+                   position: 'tuple[float, float]' = None) -> 'list[int]':
+        """
+        The indices of the chunks whose indexed ranges overlap all the given ranges.
+
+        :param laps: An inclusive range of completedLaps.
+        :param time: An inclusive range of iCurrentTime in milliseconds.
+        :param position: An inclusive range of normalizedCarPosition.
+        """
+        wanted = {"laps": laps, "time": time, "position": position}
+        result = []
+        for index, chunk in enumerate(self.chunks):
+            ranges = chunk["ranges"]
+            if all(bounds is None or (ranges[key][0] <= bounds[1] and bounds[0] <= ranges[key][1])
+                   for key, bounds in wanted.items()):
+                result.append(index)
+        return result
+
+    def _raw(self, column: Column, chunk: dict) -> memoryview:
+        start = chunk["offsets"][self._column_indices[column.name]]
+        return memoryview(self._mmap)[start:start + chunk["count"] * column.size]
+
+    def _rows(self, chunk: dict, lap: int) -> 'list[int]':
+        laps = _array("i", self._raw(self.column("graphics.completedLaps"), chunk))
+        return [row for row, value in enumerate(laps) if value == lap]
+
+    def read(self, names: 'list[str]', lap: int = None) -> dict:
+        """
+        Read whole columns, or only the frames of one lap, e.g. read(["gas", "brake"], lap=12).
+        Numeric columns are returned as flat arrays (array fields are stored frame by frame),
+        string columns as lists of str.
+
+        :param names: The names of the columns, see column().
+        :param lap: Only return the frames where completedLaps is this value.
+        """
+        columns = [self.column(name) for name in names]
+        chunks = self.chunks if lap is None else [self.chunks[index] for index in self.chunks_for(laps=(lap, lap))]
+        result = {name: ([] if column.text else array(column.format)) for name, column in zip(names, columns)}
+        for chunk in chunks:
+            rows = None if lap is None else self._rows(chunk, lap)
+            if rows == []:
+                continue
+            for name, column in zip(names, columns):
+                values = _array(column.format, self._raw(column, chunk))
+                if column.text or rows is not None:
+                    width = column.size // values.itemsize
+                    selected = range(chunk["count"]) if rows is None else rows
+                    records = [values[row * width:(row + 1) * width] for row in selected]
+                    if column.text:
+                        result[name].extend(_decode(record) for record in records)
+                    else:
+                        for record in records:
+                            result[name].extend(record)
+                else:
+                    result[name].extend(values)
+        return result
+
+    def rows(self, index: int) -> memoryview:
+        """
+        Rebuild the frames of a chunk, FRAME_SIZE bytes each, from its columns.
+
+        :param index: The index of the chunk.
+        :raises ValueError: If the file has a different page layout, see check_layout().
+        """
+        self.check_layout()
+        chunk = self.chunks[index]
+        count = chunk["count"]
+        rows = memoryview(bytearray(count * FRAME_SIZE))
+        for column in self.columns:
+            _scatter(self._raw(column, chunk), rows, count, column.offset, column.size)
+        return rows
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> 'TelemetryFile':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class TelemetryRecorder:
+    """
+    Records the physics and graphics pages every time the physics packetId advances.
+    The raw pages are copied into a preallocated ring buffer of chunks, and full chunks
+    are written to disk by a background thread, so sampling only copies memory.
+
+    The counters tell whether the capture kept up:
+    recorded is the number of frames captured, dropped the number of packets that were
+    never seen, could not be stored or kept changing while they were copied, and duplicated the number of samples that saw
+    a packet that was already recorded.
+    """
+
+    def __init__(self, path: str,
+        sim_info: SimInfo = None,
+        chunk_frames: int = 1024,
+        chunks: int = 8,
+        writer = None,
+        retries: int = 8
+    ):
+        """
+        :param path: The path of the file to record to.
+        :param sim_info: The shared memory to record, the global info if None.
+        :param chunk_frames: The number of frames in a chunk, chunks are written to disk as a whole.
+        :param chunks: The number of chunks in the ring buffer.
+        :param writer: The writer of the chunks, a ColumnWriter for path if None.
+        :param retries: How often a page is copied again when it changed during the copy,
+            see SimInfo.snapshot().
+        """
+        if chunk_frames < 1 or chunks < 2:
+            raise ValueError("The ring buffer needs at least 2 chunks of at least 1 frame.")
+        self.info = info if sim_info is None else sim_info
+        static = ctypes.string_at(ctypes.addressof(self.info.static), STATIC_SIZE)
+        self._writer = ColumnWriter(path, static) if writer is None else writer
+        self._chunk_frames = chunk_frames
+        self._chunks = chunks
+        self._retries = retries
+        self._ring = ctypes.create_string_buffer(chunk_frames * chunks * FRAME_SIZE)
+        self._ring_address = ctypes.addressof(self._ring)
+        self._ring_view = memoryview(self._ring).cast("B")
+        self._free = [True] * chunks
+        self._chunk = 0
+        self._index = 0
+        self._last_packet = None
+        self.recorded = 0
+        self.dropped = 0
+        self.duplicated = 0
+        self._queue = Queue()
+        self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def sample(self) -> bool:
+        """
+        Record the current frame if the physics packetId advanced since the last sample.
+        Call this as often as possible, e.g. from the render callback or a polling loop.
+
+        :return: True if a new frame was recorded.
+        """
+        physics = self.info.physics
+        packet_id = physics.packetId
+        last_packet = self._last_packet
+        if packet_id == last_packet:
+            self.duplicated += 1
+            return False
+        if last_packet is not None and packet_id > last_packet + 1:
+            self.dropped += packet_id - last_packet - 1
+        self._last_packet = packet_id
+        if not self._free[self._chunk]:
+            # The writer is a whole ring behind, there is nowhere to store the frame.
+            self.dropped += 1
+            return False
+        address = self._ring_address + (self._chunk * self._chunk_frames + self._index) * FRAME_SIZE
+        FRAME_TIME.pack_into(self._ring, address - self._ring_address, time.perf_counter())
+        copy = SPageFilePhysics.from_address(address + PHYSICS_OFFSET)
+        try:
+            _copy_page(copy, physics, self._retries)
+            _copy_page(SPageFileGraphic.from_address(address + GRAPHICS_OFFSET), self.info.graphics, self._retries)
+        except TornReadError:
+            # A torn frame would be stored for good, so it is dropped instead.
+            self.dropped += 1
+            return False
+        if copy.packetId != packet_id:
+            # A retry copied a newer packet, the one that was seen is lost.
+            self.dropped += copy.packetId - packet_id
+            self._last_packet = copy.packetId
+        self.recorded += 1
+        self._index += 1
+        if self._index == self._chunk_frames:
+            self._submit()
+        return True
+
+    def _submit(self) -> None:
+        self._free[self._chunk] = False
+        self._queue.put((self._chunk, self._index))
+        self._chunk = (self._chunk + 1) % self._chunks
+        self._index = 0
+
+    def _flush_loop(self) -> None:
+        chunk_size = self._chunk_frames * FRAME_SIZE
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            chunk, count = item
+            start = chunk * chunk_size
+            self._writer.write_chunk(self._ring_view[start:start + count * FRAME_SIZE], count)
+            self._free[chunk] = True
+
+    def close(self) -> None:
+        """
+        Write the frames that are left and close the file.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._index > 0:
+            self._submit()
+        self._queue.put(None)
+        self._thread.join()
+        self._writer.close()
+
+    def __enter__(self) -> 'TelemetryRecorder':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
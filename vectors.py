@@ -1,5 +1,15 @@
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Vector2D:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float = 0, y: float = 0, structure = None):
         if structure is None:
             self.x = x
@@ -8,13 +18,114 @@ class Vector2D:
             self.x = structure[0]
             self.y = structure[1]
 
+    def update(self, structure) -> 'Vector2D':
+        """
+        Set the components in place from two values, e.g. a tuple or a ctypes array.
+        Returns the vector itself.
+        """
+        self.x = structure[0]
+        self.y = structure[1]
+        return self
+
+    def copy(self) -> 'Vector2D':
+        return Vector2D(self.x, self.y)
+
+    def __add__(self, other: 'Vector2D') -> 'Vector2D':
+        return Vector2D(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: 'Vector2D') -> 'Vector2D':
+        return Vector2D(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, factor: float) -> 'Vector2D':
+        return Vector2D(self.x * factor, self.y * factor)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor: float) -> 'Vector2D':
+        return Vector2D(self.x / divisor, self.y / divisor)
+
+    def __neg__(self) -> 'Vector2D':
+        return Vector2D(-self.x, -self.y)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vector2D):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+
+    # Vectors compare by value but are changed in place, so like lists they are unhashable.
+    __hash__ = None
+
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y)[index]
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def dot(self, other: 'Vector2D') -> float:
+        return self.x * other.x + self.y * other.y
+
+    def cross(self, other: 'Vector2D') -> float:
+        """
+        The z component of the cross product, positive if other is counter-clockwise from this vector.
+        """
+        return self.x * other.y - self.y * other.x
+
+    def length(self) -> float:
+        return math.hypot(self.x, self.y)
+
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    def distance(self, other: 'Vector2D') -> float:
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def normalized(self) -> 'Vector2D':
+        """
+        The vector with length 1 in the same direction, or a zero vector if this vector is zero.
+        """
+        length = math.hypot(self.x, self.y)
+        if length == 0:
+            return Vector2D()
+        return Vector2D(self.x / length, self.y / length)
+
+    def rotated(self, angle: float) -> 'Vector2D':
+        """
+        The vector rotated counter-clockwise by an angle in radians.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        return Vector2D(self.x * cos - self.y * sin, self.x * sin + self.y * cos)
+
+    def perpendicular(self) -> 'Vector2D':
+        """
+        The vector rotated counter-clockwise by 90 degrees.
+        """
+        return Vector2D(-self.y, self.x)
+
+    def angle(self) -> float:
+        """
+        The angle of the vector from the x axis in radians.
+        """
+        return math.atan2(self.y, self.x)
+
+    def lerp(self, other: 'Vector2D', t: float) -> 'Vector2D':
+        """
+        The linear interpolation to another vector, t = 0 gives this vector and t = 1 the other.
+        """
+        return Vector2D(self.x + (other.x - self.x) * t, self.y + (other.y - self.y) * t)
+
     def __str__(self):
         return "({:.2f}, {:.2f})".format(self.x, self.y)
-    
+
     def __repr__(self):
         return str(self)
 
 class Vector3D:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float = 0, y: float = 0, z: float = 0, structure: 'tuple[float, float, float]' = None):
         if structure is None:
             self.x = x
@@ -25,14 +136,138 @@ class Vector3D:
             self.y = structure[1]
             self.z = structure[2]
 
+    def update(self, structure) -> 'Vector3D':
+        """
+        Set the components in place from three values, e.g. a tuple or a ctypes array.
+        Returns the vector itself.
+        """
+        self.x = structure[0]
+        self.y = structure[1]
+        self.z = structure[2]
+        return self
+
+    def copy(self) -> 'Vector3D':
+        return Vector3D(self.x, self.y, self.z)
+
+    def __add__(self, other: 'Vector3D') -> 'Vector3D':
+        return Vector3D(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def __sub__(self, other: 'Vector3D') -> 'Vector3D':
+        return Vector3D(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def __mul__(self, factor: float) -> 'Vector3D':
+        return Vector3D(self.x * factor, self.y * factor, self.z * factor)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor: float) -> 'Vector3D':
+        return Vector3D(self.x / divisor, self.y / divisor, self.z / divisor)
+
+    def __neg__(self) -> 'Vector3D':
+        return Vector3D(-self.x, -self.y, -self.z)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vector3D):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z
+
+    __hash__ = None
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y, self.z)[index]
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def dot(self, other: 'Vector3D') -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def cross(self, other: 'Vector3D') -> 'Vector3D':
+        return Vector3D(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x
+        )
+
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y + self.z * self.z
+
+    def distance(self, other: 'Vector3D') -> float:
+        dx, dy, dz = self.x - other.x, self.y - other.y, self.z - other.z
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+    def normalized(self) -> 'Vector3D':
+        """
+        The vector with length 1 in the same direction, or a zero vector if this vector is zero.
+        """
+        length = self.length()
+        if length == 0:
+            return Vector3D()
+        return Vector3D(self.x / length, self.y / length, self.z / length)
+
+    def rotated_x(self, angle: float) -> 'Vector3D':
+        """
+        The vector rotated around the x axis by an angle in radians.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        return Vector3D(self.x, self.y * cos - self.z * sin, self.y * sin + self.z * cos)
+
+    def rotated_y(self, angle: float) -> 'Vector3D':
+        """
+        The vector rotated around the y axis (the vertical axis in the game) by an angle in radians.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        return Vector3D(self.x * cos + self.z * sin, self.y, -self.x * sin + self.z * cos)
+
+    def rotated_z(self, angle: float) -> 'Vector3D':
+        """
+        The vector rotated around the z axis by an angle in radians.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        return Vector3D(self.x * cos - self.y * sin, self.x * sin + self.y * cos, self.z)
+
+    def rotated(self, axis: 'Vector3D', angle: float) -> 'Vector3D':
+        """
+        The vector rotated around an axis by an angle in radians (Rodrigues' rotation formula).
+        """
+        k = axis.normalized()
+        cos, sin = math.cos(angle), math.sin(angle)
+        return self * cos + k.cross(self) * sin + k * (k.dot(self) * (1 - cos))
+
+    def lerp(self, other: 'Vector3D', t: float) -> 'Vector3D':
+        """
+        The linear interpolation to another vector, t = 0 gives this vector and t = 1 the other.
+        """
+        return Vector3D(
+            self.x + (other.x - self.x) * t,
+            self.y + (other.y - self.y) * t,
+            self.z + (other.z - self.z) * t
+        )
+
+    def xz(self) -> Vector2D:
+        """
+        The horizontal components, e.g. for a track map seen from above.
+        """
+        return Vector2D(self.x, self.z)
+
     def __str__(self):
         return "({:.2f}, {:.2f}, {:.2f})".format(self.x, self.y, self.z)
-    
+
     def __repr__(self):
         return str(self)
-    
+
 
 class Vector4D:
+    __slots__ = ("x", "y", "z", "w")
+
     def __init__(self, x: float = 0, y: float = 0, z: float = 0, w: float = 0, structure = None):
         if structure is None:
             self.x = x
@@ -45,8 +280,297 @@ class Vector4D:
             self.z = structure[2]
             self.w = structure[3]
 
+    def update(self, structure) -> 'Vector4D':
+        """
+        Set the components in place from four values, e.g. a tuple or a ctypes array.
+        Returns the vector itself.
+        """
+        self.x = structure[0]
+        self.y = structure[1]
+        self.z = structure[2]
+        self.w = structure[3]
+        return self
+
+    def copy(self) -> 'Vector4D':
+        return Vector4D(self.x, self.y, self.z, self.w)
+
+    def __add__(self, other: 'Vector4D') -> 'Vector4D':
+        return Vector4D(self.x + other.x, self.y + other.y, self.z + other.z, self.w + other.w)
+
+    def __sub__(self, other: 'Vector4D') -> 'Vector4D':
+        return Vector4D(self.x - other.x, self.y - other.y, self.z - other.z, self.w - other.w)
+
+    def __mul__(self, factor: float) -> 'Vector4D':
+        return Vector4D(self.x * factor, self.y * factor, self.z * factor, self.w * factor)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor: float) -> 'Vector4D':
+        return Vector4D(self.x / divisor, self.y / divisor, self.z / divisor, self.w / divisor)
+
+    def __neg__(self) -> 'Vector4D':
+        return Vector4D(-self.x, -self.y, -self.z, -self.w)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Vector4D):
+            return NotImplemented
+        return self.x == other.x and self.y == other.y and self.z == other.z and self.w == other.w
+
+    __hash__ = None
+
+    def __len__(self) -> int:
+        return 4
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y, self.z, self.w)[index]
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.z
+        yield self.w
+
+    def dot(self, other: 'Vector4D') -> float:
+        return self.x * other.x + self.y * other.y + self.z * other.z + self.w * other.w
+
+    def length(self) -> float:
+        return math.sqrt(self.dot(self))
+
+    def normalized(self) -> 'Vector4D':
+        """
+        The vector with length 1 in the same direction, or a zero vector if this vector is zero.
+        """
+        length = self.length()
+        if length == 0:
+            return Vector4D()
+        return self / length
+
     def __str__(self):
         return "({:.2f}, {:.2f}, {:.2f}, {:.2f})".format(self.x, self.y, self.z, self.w)
-    
+
+    def __repr__(self):
+        return str(self)
+
+
+class Vector3DArray:
+    """
+    A packed array of 3D vectors, stored as float64 x, y, z of every vector after each other,
+    e.g. the world positions of all cars. The batch operations work on the whole array at once
+    and change it in place.
+
+    The array can wrap any buffer of float64 values without copying: an array('d'), a
+    CarTable column or a C-contiguous NumPy array of shape (n, 3). numpy() returns a view
+    of the same memory, so NumPy can be used for heavier math.
+    """
+    __slots__ = ("_data",)
+
+    def __init__(self, data = 0):
+        """
+        :param data: The number of vectors (all zero), a buffer of float64 values to wrap,
+            or an iterable of vectors (or tuples) to copy.
+        """
+        if isinstance(data, int):
+            self._data = memoryview(array("d", bytes(24 * data)))
+            return
+        try:
+            view = memoryview(data)
+        except TypeError:
+            values = array("d")
+            for vector in data:
+                values.extend((vector[0], vector[1], vector[2]))
+            self._data = memoryview(values)
+            return
+        if view.format != "d":
+            raise ValueError("A Vector3DArray can only wrap float64 values.")
+        if not view.c_contiguous:
+            raise ValueError("A Vector3DArray can only wrap contiguous memory.")
+        if view.ndim > 1 and view.shape[-1] != 3:
+            raise ValueError("A multi-dimensional buffer must have 3 values in its last dimension.")
+        view = view.cast("B").cast("d")
+        if len(view) % 3 != 0:
+            raise ValueError("The number of values must be a multiple of 3.")
+        self._data = view
+
+    @staticmethod
+    def from_numpy(values: 'np.ndarray') -> 'Vector3DArray':
+        """
+        Wrap a C-contiguous float64 NumPy array of shape (n, 3) without copying.
+        """
+        return Vector3DArray(values)
+
+    def numpy(self) -> 'np.ndarray':
+        """
+        A NumPy view of shape (n, 3) of the same memory. Requires NumPy.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for the array views of a Vector3DArray.")
+        return np.frombuffer(self._data, dtype=np.float64).reshape(-1, 3)
+
+    @property
+    def data(self) -> memoryview:
+        """
+        The flat float64 values.
+        """
+        return self._data
+
+    @property
+    def xs(self) -> memoryview:
+        """
+        The x components, a strided view of the data.
+        """
+        return self._data[0::3]
+
+    @property
+    def ys(self) -> memoryview:
+        """
+        The y components, a strided view of the data.
+        """
+        return self._data[1::3]
+
+    @property
+    def zs(self) -> memoryview:
+        """
+        The z components, a strided view of the data.
+        """
+        return self._data[2::3]
+
+    def copy(self) -> 'Vector3DArray':
+        return Vector3DArray(array("d", self._data))
+
+    def __len__(self) -> int:
+        return len(self._data) // 3
+
+    def _offset(self, index: int) -> int:
+        count = len(self._data) // 3
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Vector3DArray index out of range.")
+        return index * 3
+
+    def __getitem__(self, index: int) -> Vector3D:
+        offset = self._offset(index)
+        data = self._data
+        return Vector3D(data[offset], data[offset + 1], data[offset + 2])
+
+    def __setitem__(self, index: int, vector) -> None:
+        offset = self._offset(index)
+        data = self._data
+        data[offset] = vector[0]
+        data[offset + 1] = vector[1]
+        data[offset + 2] = vector[2]
+
+    def __iter__(self):
+        data = self._data.tolist()
+        for offset in range(0, len(data), 3):
+            yield Vector3D(data[offset], data[offset + 1], data[offset + 2])
+
+    def get_into(self, index: int, vector: Vector3D) -> Vector3D:
+        """
+        Write a vector of the array into a Vector3D owned by the caller and return it.
+        """
+        offset = self._offset(index)
+        data = self._data
+        vector.x = data[offset]
+        vector.y = data[offset + 1]
+        vector.z = data[offset + 2]
+        return vector
+
+    def _columns(self) -> 'tuple[list, list, list]':
+        data = self._data
+        return data[0::3].tolist(), data[1::3].tolist(), data[2::3].tolist()
+
+    def _store(self, xs, ys, zs) -> None:
+        data = self._data
+        data[0::3] = array("d", xs)
+        data[1::3] = array("d", ys)
+        data[2::3] = array("d", zs)
+
+    def translate(self, offset: Vector3D) -> 'Vector3DArray':
+        """
+        Add a vector to all vectors. Returns the array itself.
+        """
+        xs, ys, zs = self._columns()
+        dx, dy, dz = offset[0], offset[1], offset[2]
+        self._store([x + dx for x in xs], [y + dy for y in ys], [z + dz for z in zs])
+        return self
+
+    def scale(self, factor: float) -> 'Vector3DArray':
+        """
+        Multiply all vectors by a factor. Returns the array itself.
+        """
+        data = self._data
+        data[:] = array("d", [value * factor for value in data.tolist()])
+        return self
+
+    def transform(self, matrix: 'tuple[tuple[float, float, float], ...]', offset: Vector3D = None) -> 'Vector3DArray':
+        """
+        Multiply all vectors by a 3x3 matrix (given as rows) and add an offset,
+        e.g. to rotate, scale and move world positions onto a map in one pass.
+        Returns the array itself.
+        """
+        (a, b, c), (d, e, f), (g, h, i) = matrix
+        dx, dy, dz = (0.0, 0.0, 0.0) if offset is None else (offset[0], offset[1], offset[2])
+        xs, ys, zs = self._columns()
+        points = list(zip(xs, ys, zs))
+        self._store(
+            [a * x + b * y + c * z + dx for x, y, z in points],
+            [d * x + e * y + f * z + dy for x, y, z in points],
+            [g * x + h * y + i * z + dz for x, y, z in points]
+        )
+        return self
+
+    def rotate_y(self, angle: float, origin: Vector3D = None) -> 'Vector3DArray':
+        """
+        Rotate all vectors around the vertical axis by an angle in radians,
+        around an origin if given. Returns the array itself.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        matrix = ((cos, 0.0, sin), (0.0, 1.0, 0.0), (-sin, 0.0, cos))
+        if origin is None:
+            return self.transform(matrix)
+        self.translate(-Vector3D(structure=origin))
+        return self.transform(matrix, origin)
+
+    def lengths(self) -> array:
+        """
+        The length of every vector.
+        """
+        sqrt = math.sqrt
+        xs, ys, zs = self._columns()
+        return array("d", [sqrt(x * x + y * y + z * z) for x, y, z in zip(xs, ys, zs)])
+
+    def dot(self, vector: Vector3D) -> array:
+        """
+        The dot product of every vector with a vector.
+        """
+        vx, vy, vz = vector[0], vector[1], vector[2]
+        xs, ys, zs = self._columns()
+        return array("d", [x * vx + y * vy + z * vz for x, y, z in zip(xs, ys, zs)])
+
+    def distances(self, point: Vector3D) -> array:
+        """
+        The distance of every vector to a point, e.g. of every car to the player.
+        """
+        sqrt = math.sqrt
+        px, py, pz = point[0], point[1], point[2]
+        xs, ys, zs = self._columns()
+        return array("d", [
+            sqrt((x - px) * (x - px) + (y - py) * (y - py) + (z - pz) * (z - pz))
+            for x, y, z in zip(xs, ys, zs)
+        ])
+
+    def bounds(self) -> 'tuple[Vector3D, Vector3D]':
+        """
+        The smallest and largest components of all vectors, as two corners of a box.
+        """
+        if len(self._data) == 0:
+            raise ValueError("An empty Vector3DArray has no bounds.")
+        xs, ys, zs = self._columns()
+        return Vector3D(min(xs), min(ys), min(zs)), Vector3D(max(xs), max(ys), max(zs))
+
+    def __str__(self):
+        return "[{}]".format(", ".join(str(vector) for vector in self))
+
     def __repr__(self):
-        return str(self)
\ No newline at end of file
+        return "Vector3DArray({})".format(self)